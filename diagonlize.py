@@ -1,32 +1,99 @@
+import sqlite3
+import time
+from collections.abc import Mapping
+from fractions import Fraction
+
 import numpy as np
-from sympy import Matrix
+from sympy import I, Matrix, Rational, gcd, simplify
 from functools import lru_cache
 
-# ======== Caching using Python Hashmaps (dict) + LRU ========
+from eigen_cache import get_default_cache
+from eigen_domain import (
+    charpoly_coeffs, diagonalizability, domain_eigenvals, domain_eigenvects,
+    factor_charpoly, is_rational_matrix, to_domain_matrix,
+)
+from eigen_numeric import batched_eigen_data, choose_mode, numeric_eigen_data
+from eigen_structure import (
+    DIAGONAL, UPPER_TRIANGULAR, LOWER_TRIANGULAR, BLOCK_DIAGONAL,
+    detect_structure, diagonal_eigenvals, diagonal_eigenvects,
+    triangular_eigenvects, merge_block_eigenvals, merge_block_eigenvects,
+)
 
-@lru_cache(maxsize=32)
-def compute_eigen_data(matrix_tuple):
+# ======== Single-pass Eigen Engine ========
+
+def _primitive(v):
+    # Clear common denominators the same way Matrix.diagonalize() does
+    v = v / gcd(list(v))
+    if all(x.is_Rational for x in v):
+        return v
+    return v.applyfunc(simplify)
+
+
+def _diagonalization(eigenspaces):
     """
-    Cached eigenvalue/eigenspace computation.
-    Input matrix is passed as tuple-of-tuples (hashable).
+    Derive diagonalizability and P, D from already computed eigenspaces.
+    Mirrors Matrix.diagonalize(): columns of P follow the eigenspace order.
     """
-    M = Matrix(matrix_tuple)
-    
-    # Eigenvalues (exact symbolic)
-    eigenvals = M.eigenvals()   # dict: {eigenvalue: algebraic_multiplicity}
-    
-    # Eigenspaces
-    eigenspaces = {}
-    for val in eigenvals:
-        eigenspaces[val] = M.eigenvects()  # will filter later
-    
-    return eigenvals, eigenspaces
+    diagonalizable = all(
+        data["algebraic_multiplicity"] == data["geometric_multiplicity"]
+        for data in eigenspaces.values()
+    )
+    if not diagonalizable or not eigenspaces:
+        return diagonalizable, None, None
 
+    p_cols, diag = [], []
+    for val, data in eigenspaces.items():
+        diag += [val] * data["algebraic_multiplicity"]
+        p_cols += [_primitive(v) for v in data["basis"]]
 
-def get_eigenspaces(matrix_tuple):
-    M = Matrix(matrix_tuple)
-    eigvecs = M.eigenvects()
+    return True, Matrix.hstack(*p_cols), Matrix.diag(*diag)
 
+
+def _structured_eigenvals(M):
+    """
+    Eigenvalues only, via the cheapest exact path for M's structure.
+    Returns (structure, eigenvals, charpoly factors or None); the factors
+    let a later eigenvector stage skip the charpoly.
+    """
+    kind, blocks = detect_structure(M)
+
+    if kind in (DIAGONAL, UPPER_TRIANGULAR, LOWER_TRIANGULAR):
+        return kind, diagonal_eigenvals(M), None
+    if kind == BLOCK_DIAGONAL:
+        block_results = [
+            _structured_eigenvals(M.extract(indices, indices))[1]
+            for indices in blocks
+        ]
+        return kind, merge_block_eigenvals(block_results), None
+    if is_rational_matrix(M):
+        factors = factor_charpoly(*charpoly_coeffs(to_domain_matrix(M)))
+        return kind, domain_eigenvals(M, factors), factors
+    return kind, M.eigenvals(), None
+
+
+def _structured_eigenvects(M, factors=None):
+    """
+    Dispatch to the cheapest exact path for M's structure.
+    Returns (structure, eigenvects list in Matrix.eigenvects() format).
+    """
+    kind, blocks = detect_structure(M)
+
+    if kind == DIAGONAL:
+        return kind, diagonal_eigenvects(M)
+    if kind in (UPPER_TRIANGULAR, LOWER_TRIANGULAR):
+        return kind, triangular_eigenvects(M)
+    if kind == BLOCK_DIAGONAL:
+        block_results = [
+            _structured_eigenvects(M.extract(indices, indices))[1]
+            for indices in blocks
+        ]
+        return kind, merge_block_eigenvects(M.rows, blocks, block_results)
+    if is_rational_matrix(M):
+        return kind, domain_eigenvects(M, factors)
+    return kind, M.eigenvects()
+
+
+def _eigenspaces(eigvecs):
     eigenspaces = {}
     for eigenvalue, algebraic_multiplicity, eigspace_basis in eigvecs:
         eigenspaces[eigenvalue] = {
@@ -37,40 +104,313 @@ def get_eigenspaces(matrix_tuple):
     return eigenspaces
 
 
+def _eigen_engine(M):
+    """
+    Run the expensive symbolic work (charpoly + nullspaces) exactly once
+    and derive everything else from that result. Structured matrices
+    (diagonal, triangular, block-diagonal up to permutation) skip the
+    full-size charpoly entirely.
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    structure, eigvecs = _structured_eigenvects(M)
+    timings["eigenvects"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    eigenspaces = _eigenspaces(eigvecs)
+    eigenvals = {
+        val: data["algebraic_multiplicity"] for val, data in eigenspaces.items()
+    }
+    diagonalizable, P, D = _diagonalization(eigenspaces)
+    timings["derive"] = time.perf_counter() - start
+
+    return {
+        "eigenvalues": eigenvals,
+        "eigenspaces": eigenspaces,
+        "diagonalizable": diagonalizable,
+        "P": P,
+        "D": D,
+        "structure": structure,
+        "timings": timings
+    }
+
+
+# ======== Caching: LRU (per process) + persistent on-disk store ========
+
+@lru_cache(maxsize=32)
+def compute_eigen_data(matrix_tuple):
+    """
+    Cached eigenvalue/eigenspace/diagonalization computation.
+    Input matrix is passed as tuple-of-tuples (hashable).
+
+    Misses in the in-process LRU fall through to the persistent cache
+    (see eigen_cache.py) before any symbolic work is done.
+    """
+    cache = get_default_cache()
+    if cache is not None:
+        start = time.perf_counter()
+        try:
+            data = cache.get(matrix_tuple)
+        except sqlite3.Error:
+            data = None
+        if data is not None:
+            data["timings"] = {"cache": time.perf_counter() - start}
+            return data
+
+    start = time.perf_counter()
+    M = Matrix(matrix_tuple)
+    build_time = time.perf_counter() - start
+
+    data = _eigen_engine(M)
+    data["timings"] = {"matrix": build_time, **data["timings"]}
+
+    if cache is not None:
+        try:
+            cache.put(matrix_tuple, data)
+        except sqlite3.Error:
+            pass
+    return data
+
+
+def get_eigenspaces(matrix_tuple):
+    return compute_eigen_data(matrix_tuple)["eigenspaces"]
+
+
+# ======== Lazy Result Object ========
+
+class EigenAnalysis(Mapping):
+    """
+    Lazy, dict-compatible result of analyze_matrix.
+
+    Each field is computed on first access and memoized. Fields share their
+    intermediates: eigenspaces reuse the eigenvalues (and, for rational
+    matrices, the factored charpoly), P/D reuse the eigenspaces, and
+    "diagonalizable" alone is decided from the minimal polynomial without
+    any eigenvectors.
+    """
+
+    FIELDS = ("eigenvalues", "eigenspaces", "diagonalizable", "P", "D", "structure", "timings")
+
+    def __init__(self, matrix_tuple):
+        self._tuple = matrix_tuple
+        self._M = None
+        self._factors = None
+        self._cache_checked = False
+        self._values = {"timings": {}}
+
+    # ---- Mapping interface ----
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        if key not in self._values:
+            self._check_cache()
+        if key not in self._values:
+            getattr(self, "_compute_" + key)()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __repr__(self):
+        computed = {key: self._values[key] for key in self.FIELDS if key in self._values}
+        return f"EigenAnalysis({computed!r})"
+
+    # ---- Stages ----
+
+    def _timed(self, stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self._values["timings"][stage] = time.perf_counter() - start
+        return result
+
+    def _matrix(self):
+        if self._M is None:
+            self._M = self._timed("matrix", Matrix, self._tuple)
+        return self._M
+
+    def _check_cache(self):
+        # A persistent cache hit fills every field at once
+        if self._cache_checked:
+            return
+        self._cache_checked = True
+        cache = get_default_cache()
+        if cache is None:
+            return
+        try:
+            data = self._timed("cache", cache.get, self._tuple)
+        except sqlite3.Error:
+            data = None
+        if data is not None:
+            data.pop("timings", None)
+            self._values.update(data)
+
+    def _compute_structure(self):
+        self._values["structure"] = self._timed("structure", detect_structure, self._matrix())[0]
+
+    def _compute_eigenvalues(self):
+        structure, eigenvals, factors = self._timed(
+            "eigenvalues", _structured_eigenvals, self._matrix()
+        )
+        self._values["structure"] = structure
+        self._values["eigenvalues"] = eigenvals
+        self._factors = factors
+
+    def _compute_eigenspaces(self):
+        self["eigenvalues"]  # memoized; also leaves the factored charpoly behind
+        _, eigvecs = self._timed(
+            "eigenspaces", _structured_eigenvects, self._matrix(), self._factors
+        )
+        eigenspaces = _eigenspaces(eigvecs)
+        diagonalizable, P, D = self._timed("derive", _diagonalization, eigenspaces)
+        self._values.update(
+            eigenspaces=eigenspaces, diagonalizable=diagonalizable, P=P, D=D
+        )
+
+        cache = get_default_cache()
+        if cache is not None:
+            data = {key: self._values[key] for key in self.FIELDS if key != "timings"}
+            try:
+                cache.put(self._tuple, data)
+            except sqlite3.Error:
+                pass
+
+    def _compute_diagonalizable(self):
+        M = self._matrix()
+        if is_rational_matrix(M):
+            verdict = self._timed("diagonalizable", diagonalizability, M)
+            self._values["diagonalizable"] = verdict["over_C"]
+        else:
+            self._compute_eigenspaces()
+
+    def _compute_P(self):
+        self._compute_eigenspaces()
+
+    def _compute_D(self):
+        self._compute_eigenspaces()
+
+
+@lru_cache(maxsize=32)
+def _lazy_analysis(matrix_tuple):
+    # Repeated calls on the same matrix share one memoizing result object
+    return EigenAnalysis(matrix_tuple)
+
+
 # ======== Main Function: Eigenvalues, Eigenspaces, Diagonalization ========
 
-def analyze_matrix(A):
+def analyze_matrix(A, mode="symbolic"):
     """
     A: Python list of lists (matrix)
+    mode: "symbolic" (exact SymPy), "numeric" (LAPACK, see eigen_numeric.py)
+          or "auto" (numeric for large or floating point matrices)
     
     Returns eigenvalues, eigenspaces, and diagonalization info.
+    In symbolic mode the result is a lazy EigenAnalysis mapping: each field
+    is computed on first access. The "timings" entry reports seconds spent
+    per stage so far.
     """
-    A_np = np.array(A, dtype=float)
-    M = Matrix(A)
+    if mode == "auto":
+        mode = choose_mode(A)
+    if mode == "numeric":
+        return numeric_eigen_data(A)
+    if mode != "symbolic":
+        raise ValueError(f"Unknown mode: {mode!r}")
 
     # Convert to hashable tuple for caching
     A_tuple = tuple(tuple(row) for row in A)
+    return _lazy_analysis(A_tuple)
 
-    # fetch eigenvalues + eigenspaces (cached)
-    eigenvals, _ = compute_eigen_data(A_tuple)
 
-    eigenspaces = get_eigenspaces(A_tuple)
+# ======== Diagonalizability Only ========
 
-    # Try diagonalization
-    try:
-        P, D = M.diagonalize()
-        diagonalizable = True
-    except:
-        P, D = None, None
-        diagonalizable = False
+def is_diagonalizable(A, over="C"):
+    """
+    A: Python list of lists (matrix)
+    over: "C", "R" or "Q"
+
+    For integer/rational matrices this never computes eigenvalues or
+    eigenvectors: it checks that the minimal polynomial is squarefree
+    (see eigen_domain.diagonalizability). Other matrices fall back to the
+    cached eigen engine.
+    """
+    if over not in ("C", "R", "Q"):
+        raise ValueError(f"Unknown field: {over!r}")
+
+    A_tuple = tuple(tuple(row) for row in A)
+    M = Matrix(A_tuple)
+    if is_rational_matrix(M):
+        return diagonalizability(M)["over_" + over]
+
+    data = compute_eigen_data(A_tuple)
+    if not data["diagonalizable"] or over == "C":
+        return data["diagonalizable"]
+    if over == "R":
+        return all(val.is_real for val in data["eigenvalues"])
+    return all(val.is_rational for val in data["eigenvalues"])
+
+
+# ======== Batched Analysis over Stacks of Small Matrices ========
+
+def _exact_real(x):
+    x = float(x)
+    return int(x) if x.is_integer() else Rational(Fraction(x))
 
-    return {
-        "eigenvalues": eigenvals,
-        "eigenspaces": eigenspaces,
-        "diagonalizable": diagonalizable,
-        "P": P,
-        "D": D
-    }
+
+def _exact_entry(x):
+    # Floats are converted exactly (binary value), integers stay integers;
+    # complex entries keep their imaginary part as re + I*im
+    x = complex(x)
+    if x.imag == 0:
+        return _exact_real(x.real)
+    return _exact_real(x.real) + I * _exact_real(x.imag)
+
+
+def _exact_tuple(A):
+    return tuple(tuple(_exact_entry(x) for x in row) for row in A)
+
+
+def _exact_multiplicities(A_tuple, eigenvalues):
+    # Exact (algebraic, geometric) multiplicity for every numeric eigenvalue
+    # slot, taken from the nearest exact eigenvalue
+    eigenspaces = compute_eigen_data(A_tuple)["eigenspaces"]
+    exact = list(eigenspaces.values())
+    points = np.array([complex(val.evalf()) for val in eigenspaces])
+    nearest = np.abs(np.asarray(eigenvalues)[:, None] - points[None, :]).argmin(axis=1)
+    algebraic = [exact[i]["algebraic_multiplicity"] for i in nearest]
+    geometric = [exact[i]["geometric_multiplicity"] for i in nearest]
+    return algebraic, geometric
+
+
+def analyze_matrices(stack, exact_recheck=False, tol=None):
+    """
+    stack: (N, n, n) array of real or complex matrices
+
+    Returns a NumPy structured array with one record per matrix
+    (see eigen_numeric.batch_dtype) instead of N result dicts.
+    With exact_recheck=True, only the records flagged near_defective are
+    re-decided exactly with is_diagonalizable; those get exact=True. When
+    the exact verdict reverses the numeric one, the multiplicities are
+    replaced by the exact ones so the record stays consistent.
+    """
+    stack = np.asarray(stack)
+    out = batched_eigen_data(stack, tol=tol)
+
+    if exact_recheck:
+        for k in np.flatnonzero(out["near_defective"]):
+            A_tuple = _exact_tuple(stack[k])
+            verdict = is_diagonalizable(A_tuple)
+            if verdict != out["diagonalizable"][k]:
+                algebraic, geometric = _exact_multiplicities(A_tuple, out["eigenvalues"][k])
+                out["algebraic_multiplicity"][k] = algebraic
+                out["geometric_multiplicity"][k] = geometric
+            out["diagonalizable"][k] = verdict
+            out["exact"][k] = True
+
+    return out
 
 
 # ======== Example Usage ========
@@ -104,4 +444,8 @@ if __name__ == "__main__":
         print("\nP (eigenvector matrix):")
         print(result["P"])
         print("\nD (diagonal matrix):")
-        print(result["D"])
\ No newline at end of file
+        print(result["D"])
+
+    print("\n--- Stage timings (s) ---")
+    for stage, seconds in result["timings"].items():
+        print(f"{stage}: {seconds:.6f}")
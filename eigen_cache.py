@@ -0,0 +1,244 @@
+"""
+Persistent, size-bounded cache for eigen decompositions.
+
+Results are keyed on a canonical serialization of the matrix (SHA-256 of
+the shape plus the srepr of every entry) and stored as srepr strings in a
+local SQLite file, so they survive worker restarts and can be shared by
+several processes at once.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from sympy import srepr, sympify
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Part of every key; bump it when stored results change (layout or eigenvalue
+# order) so entries written by older code are never served
+KEY_VERSION = 2
+DEFAULT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "codeformaths", "eigen_cache.sqlite3"
+)
+
+# ======== Canonical Keys + Portable Serialization ========
+
+def matrix_key(matrix_tuple):
+    """
+    Content address of a matrix: the same entries always give the same key,
+    whichever process or Python version computed it.
+    """
+    rows = len(matrix_tuple)
+    cols = len(matrix_tuple[0]) if rows else 0
+    entries = [srepr(sympify(x)) for row in matrix_tuple for x in row]
+    canonical = json.dumps([KEY_VERSION, rows, cols, entries], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _dump(expr):
+    return None if expr is None else srepr(expr)
+
+
+def _load(text):
+    return None if text is None else sympify(text)
+
+
+def serialize_eigen_data(data):
+    payload = {
+        "eigenvalues": [
+            [srepr(val), mult] for val, mult in data["eigenvalues"].items()
+        ],
+        "eigenspaces": [
+            [
+                srepr(val),
+                space["algebraic_multiplicity"],
+                space["geometric_multiplicity"],
+                [srepr(v) for v in space["basis"]],
+            ]
+            for val, space in data["eigenspaces"].items()
+        ],
+        "diagonalizable": data["diagonalizable"],
+        "P": _dump(data["P"]),
+        "D": _dump(data["D"]),
+        "structure": data.get("structure"),
+    }
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def deserialize_eigen_data(blob):
+    payload = json.loads(blob.decode("utf-8"))
+
+    eigenvals = {}
+    for val, mult in payload["eigenvalues"]:
+        eigenvals[sympify(val)] = mult
+
+    eigenspaces = {}
+    for val, alg, geom, basis in payload["eigenspaces"]:
+        eigenspaces[sympify(val)] = {
+            "algebraic_multiplicity": alg,
+            "geometric_multiplicity": geom,
+            "basis": [sympify(v) for v in basis]
+        }
+
+    return {
+        "eigenvalues": eigenvals,
+        "eigenspaces": eigenspaces,
+        "diagonalizable": payload["diagonalizable"],
+        "P": _load(payload["P"]),
+        "D": _load(payload["D"]),
+        "structure": payload.get("structure"),
+    }
+
+
+# ======== SQLite-backed LRU Store ========
+
+class EigenCache:
+    """
+    Content-addressed eigen result store with LRU eviction by total size.
+
+    SQLite runs in WAL mode with a busy timeout, and every write happens in
+    an IMMEDIATE transaction, so concurrent readers and writers from several
+    processes never see a half-written entry.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES, timeout=30.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_read": 0,
+            "bytes_written": 0,
+            "evictions": 0,
+        }
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS eigen_cache ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS eigen_cache_lru ON eigen_cache (last_access)"
+        )
+
+    def _connect(self):
+        # One connection per thread and per process (connections must not
+        # cross a fork)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, matrix_tuple):
+        """Return the cached result dict, or None on a miss."""
+        key = matrix_key(matrix_tuple)
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT payload FROM eigen_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+
+        conn.execute(
+            "UPDATE eigen_cache SET last_access = ? WHERE key = ?",
+            (time.time(), key),
+        )
+        blob = row[0]
+        self.stats["hits"] += 1
+        self.stats["bytes_read"] += len(blob)
+        return deserialize_eigen_data(blob)
+
+    def put(self, matrix_tuple, data):
+        """Store a result and evict least recently used entries over budget."""
+        key = matrix_key(matrix_tuple)
+        blob = serialize_eigen_data(data)
+        if len(blob) > self.max_bytes:
+            return
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO eigen_cache (key, payload, size, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            self.stats["bytes_written"] += len(blob)
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM eigen_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in conn.execute(
+            "SELECT key, size FROM eigen_cache ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM eigen_cache WHERE key = ?", (key,))
+            total -= size
+            self.stats["evictions"] += 1
+
+    def total_bytes(self):
+        conn = self._connect()
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM eigen_cache").fetchone()[0]
+
+    def __len__(self):
+        conn = self._connect()
+        return conn.execute("SELECT COUNT(*) FROM eigen_cache").fetchone()[0]
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM eigen_cache")
+
+
+# ======== Process-wide Default Cache ========
+
+_default_cache = None
+_default_cache_loaded = False
+
+
+def get_default_cache():
+    """
+    The cache analyze_matrix uses. Its location comes from EIGEN_CACHE_PATH;
+    set EIGEN_CACHE_PATH to an empty string to disable persistent caching.
+    """
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache_loaded = True
+        path = os.environ.get("EIGEN_CACHE_PATH", DEFAULT_PATH)
+        max_bytes = int(os.environ.get("EIGEN_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        if path:
+            try:
+                _default_cache = EigenCache(path, max_bytes=max_bytes)
+            except (OSError, sqlite3.Error):
+                _default_cache = None
+    return _default_cache
+
+
+def set_default_cache(cache):
+    """Replace (or with None, disable) the cache analyze_matrix uses."""
+    global _default_cache, _default_cache_loaded
+    _default_cache = cache
+    _default_cache_loaded = True
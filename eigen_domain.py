@@ -0,0 +1,254 @@
+"""
+Exact eigen backend for integer/rational matrices on SymPy's polynomial
+domain matrices (DomainMatrix over ZZ/QQ).
+
+The charpoly is computed fraction-free over ZZ (Berkowitz), factored over
+QQ, and nullspaces are taken in the domain: over QQ for rational
+eigenvalues, and once per irreducible factor f over QQ[x]/(f) for algebraic
+ones. Only the final eigenvalues and basis vectors become Expr objects, so
+the output matches Matrix.eigenvects() exactly.
+"""
+
+import time
+
+from sympy import CRootOf, Dummy, Matrix, Poly, roots
+from sympy.core.sorting import default_sort_key
+from sympy.polys.agca.extensions import FiniteExtension
+from sympy.polys.domains import QQ, ZZ
+from sympy.polys.densearith import dup_quo
+from sympy.polys.densebasic import dup_degree
+from sympy.polys.densetools import dup_diff
+from sympy.polys.euclidtools import dup_gcd
+from sympy.polys.factortools import dup_factor_list
+from sympy.polys.matrices import DomainMatrix
+
+_LAMBDA = Dummy("lambda")
+
+
+# ======== Domain Conversion ========
+
+def is_rational_matrix(M):
+    """True if every entry of the SymPy Matrix is an Integer or Rational."""
+    return all(x.is_Rational for x in M)
+
+
+def to_domain_matrix(M):
+    """
+    Build the DomainMatrix straight from the entries' numerators and
+    denominators (no Expr-level domain construction). ZZ if every entry is
+    an integer, QQ otherwise.
+    """
+    rows, cols = M.shape
+    if all(x.is_Integer for x in M):
+        items = [[ZZ(int(M[i, j])) for j in range(cols)] for i in range(rows)]
+        return DomainMatrix(items, (rows, cols), ZZ)
+    items = [[QQ(int(M[i, j].p), int(M[i, j].q)) for j in range(cols)] for i in range(rows)]
+    return DomainMatrix(items, (rows, cols), QQ)
+
+
+# ======== Characteristic Polynomial ========
+
+def charpoly_coeffs(dM):
+    """
+    Charpoly coefficients (highest degree first) over ZZ, computed with the
+    fraction-free Berkowitz algorithm. A QQ matrix is scaled by the lcm d of
+    its denominators first: if dA has charpoly sum b_k x^(n-k), then A has
+    charpoly sum (b_k / d^k) x^(n-k), returned over QQ.
+    """
+    if dM.domain == ZZ:
+        return dM.charpoly(), ZZ
+
+    d = ZZ.one
+    for row in dM.to_list():
+        for x in row:
+            d = ZZ.lcm(d, x.denominator)
+    scaled = (dM * QQ(d)).convert_to(ZZ)
+    coeffs = scaled.charpoly()
+    return [QQ(c) / QQ(d) ** k for k, c in enumerate(coeffs)], QQ
+
+
+def factor_charpoly(coeffs, domain):
+    """Irreducible factors over QQ as [(base, exponent)], bases over QQ."""
+    _, factors = dup_factor_list(coeffs, domain)
+    return [([QQ.convert(c, domain) for c in base], exp) for base, exp in factors]
+
+
+def _factor_roots(base):
+    """Exact roots of one irreducible factor, in the same form SymPy uses."""
+    if len(base) == 2:
+        return [QQ.to_sympy(-base[1] / base[0])]
+    minpoly = Poly.from_list(base, _LAMBDA, domain=QQ)
+    degree = minpoly.degree()
+    found = roots(minpoly.as_expr(), _LAMBDA)
+    if len(found) != degree:
+        found = [CRootOf(minpoly.as_expr(), _LAMBDA, idx) for idx in range(degree)]
+    return list(found)
+
+
+# ======== Eigenvalues / Eigenvectors ========
+
+def domain_eigenvals(M, factors=None):
+    """Eigenvalues {value: algebraic multiplicity} without any nullspace work."""
+    if factors is None:
+        factors = factor_charpoly(*charpoly_coeffs(to_domain_matrix(M)))
+    eigenvals = {}
+    for base, exp in factors:
+        for val in _factor_roots(base):
+            eigenvals[val] = eigenvals.get(val, 0) + exp
+    return eigenvals
+
+
+def _rational_eigenvects(dM, base, exp):
+    rows, cols = dM.shape
+    eigenval = -base[1] / base[0]
+    shift = DomainMatrix.eye(rows, QQ) * eigenval
+    basis = (dM - shift).nullspace(divide_last=True).to_list()
+    vectors = [Matrix([QQ.to_sympy(x) for x in vect]) for vect in basis]
+    return [(QQ.to_sympy(eigenval), exp, vectors)]
+
+
+def _algebraic_eigenvects(dM, base, exp):
+    # One nullspace over QQ[x]/(f) covers every root of the factor f
+    rows, cols = dM.shape
+    minpoly = Poly.from_list(base, _LAMBDA, domain=QQ)
+    field = FiniteExtension(minpoly)
+    theta = field(_LAMBDA)
+
+    items = [
+        [field(Poly.from_list([x], _LAMBDA, domain=QQ).rep) for x in row]
+        for row in dM.to_list()
+    ]
+    AA = DomainMatrix(items, (rows, cols), field)
+    EE = DomainMatrix(
+        [[theta if i == j else field.zero for j in range(cols)] for i in range(rows)],
+        (rows, cols), field,
+    )
+    basis = (AA - EE).nullspace(divide_last=True).to_list()
+    basis = [[field.to_sympy(x) for x in vect] for vect in basis]
+
+    result = []
+    for eigenval in _factor_roots(base):
+        vectors = [Matrix([x.subs(_LAMBDA, eigenval) for x in vect]) for vect in basis]
+        result.append((eigenval, exp, vectors))
+    return result
+
+
+def domain_eigenvects(M, factors=None):
+    """
+    Drop-in replacement for M.eigenvects() on integer/rational matrices.
+    A precomputed charpoly factorization can be passed in to skip that stage.
+    """
+    dM = to_domain_matrix(M).convert_to(QQ)
+    if factors is None:
+        factors = factor_charpoly(*charpoly_coeffs(dM))
+
+    eigvecs = []
+    for base, exp in factors:
+        if len(base) == 2:
+            eigvecs += _rational_eigenvects(dM, base, exp)
+        else:
+            eigvecs += _algebraic_eigenvects(dM, base, exp)
+    return sorted(eigvecs, key=lambda item: default_sort_key(item[0]))
+
+
+# ======== Diagonalizability via the Minimal Polynomial ========
+
+def squarefree_part(coeffs, domain):
+    """p / gcd(p, p'): the product of the distinct irreducible factors of p."""
+    coeffs = [QQ.convert(c, domain) for c in coeffs]
+    g = dup_gcd(coeffs, dup_diff(coeffs, 1, QQ), QQ)
+    return dup_quo(coeffs, g, QQ)
+
+
+def _poly_of_matrix(coeffs, dM):
+    # Horner evaluation of p(A) entirely in QQ
+    n = dM.shape[0]
+    identity = DomainMatrix.eye(n, QQ)
+    result = identity * coeffs[0]
+    for c in coeffs[1:]:
+        result = result * dM + identity * c
+    return result
+
+
+def diagonalizability(M):
+    """
+    Decide diagonalizability of an integer/rational matrix without computing
+    eigenvalues or eigenvectors.
+
+    The minimal polynomial has the same irreducible factors as the charpoly
+    p and divides it, so it is squarefree (A diagonalizable over C) iff the
+    squarefree part p / gcd(p, p') annihilates A. Over R additionally every
+    root of that squarefree part must be real (Sturm count), over Q every
+    one of its irreducible factors must be linear.
+    """
+    dM = to_domain_matrix(M)
+    coeffs, domain = charpoly_coeffs(dM)
+    dM = dM.convert_to(QQ)
+
+    radical = squarefree_part(coeffs, domain)
+    over_C = _poly_of_matrix(radical, dM).is_zero_matrix
+
+    over_R = over_Q = False
+    if over_C:
+        radical_poly = Poly.from_list(radical, _LAMBDA, domain=QQ)
+        over_R = radical_poly.count_roots() == dup_degree(radical)
+        if over_R:
+            over_Q = all(len(base) == 2 for base, _ in factor_charpoly(radical, QQ))
+
+    return {
+        "over_C": over_C,
+        "over_R": over_R,
+        "over_Q": over_Q,
+        "charpoly": Poly.from_list(coeffs, _LAMBDA, domain=domain),
+        "squarefree_part": Poly.from_list(radical, _LAMBDA, domain=QQ),
+        # when over_C holds, the squarefree part *is* the minimal polynomial
+        "minimal_polynomial": Poly.from_list(radical, _LAMBDA, domain=QQ) if over_C else None,
+    }
+
+
+# ======== Benchmark ========
+
+def _similar_integer_matrix(n, rng):
+    # U B U^-1 with B block diagonal (1x1 and 2x2 blocks) and U unimodular:
+    # a dense integer matrix whose eigenvalues are rational or quadratic
+    B = Matrix.zeros(n, n)
+    i = 0
+    while i < n:
+        if i + 1 < n and rng.random() < 0.5:
+            B[i:i + 2, i:i + 2] = Matrix(2, 2, lambda *_: rng.randint(-4, 4))
+            i += 2
+        else:
+            B[i, i] = rng.randint(-4, 4)
+            i += 1
+    U = Matrix.eye(n)
+    for _ in range(2 * n):
+        r, c = rng.sample(range(n), 2)
+        U[r, :] = U[r, :] + rng.choice([-1, 1]) * U[c, :]
+    return U * B * U.inv()
+
+
+def benchmark(sizes=range(4, 11), trials=3, seed=0):
+    """Compare domain_eigenvects with Matrix.eigenvects on dense integer matrices."""
+    import random
+
+    rng = random.Random(seed)
+    print(f"{'n':>3} {'Matrix.eigenvects':>18} {'domain_eigenvects':>18} {'speedup':>8}")
+    for n in sizes:
+        generic = domain = 0.0
+        for _ in range(trials):
+            M = _similar_integer_matrix(n, rng)
+
+            start = time.perf_counter()
+            expected = M.eigenvects()
+            generic += time.perf_counter() - start
+
+            start = time.perf_counter()
+            got = domain_eigenvects(M)
+            domain += time.perf_counter() - start
+
+            assert got == expected
+        print(f"{n:>3} {generic / trials:>18.4f} {domain / trials:>18.4f} {generic / domain:>7.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
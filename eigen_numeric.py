@@ -0,0 +1,244 @@
+"""
+Numeric (LAPACK) eigen analysis for matrices too large for SymPy.
+
+Eigenvalues come from a dense eigendecomposition, are clustered within a
+tolerance to recover algebraic multiplicities, and the geometric
+multiplicity of every repeated cluster is the numerical nullity of
+(A - λI) from its SVD. The result has the same shape as
+diagonlize.analyze_matrix.
+"""
+
+import time
+
+import numpy as np
+
+try:
+    from scipy import linalg as _linalg
+except ImportError:  # SciPy is optional; NumPy's LAPACK bindings suffice
+    _linalg = np.linalg
+
+DEFAULT_CLUSTER_TOL = 1e-6
+DEFAULT_MAX_CONDITION = 1e10
+SYMBOLIC_MAX_DIM = 8
+
+
+# ======== Helpers ========
+
+def _scalar(z, tol):
+    # Drop negligible imaginary parts so real spectra get real keys
+    z = complex(z)
+    return z.real if abs(z.imag) <= tol else z
+
+
+def cluster_eigenvalues(eigenvalues, tol):
+    """
+    Group eigenvalues closer than tol (single linkage).
+    Returns a list of index arrays, one per cluster.
+    """
+    n = len(eigenvalues)
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    order = np.argsort(eigenvalues.real, kind="stable")
+    real = eigenvalues.real[order]
+    for a in range(n):
+        b = a + 1
+        while b < n and real[b] - real[a] <= tol:
+            i, j = order[a], order[b]
+            if abs(eigenvalues[i] - eigenvalues[j]) <= tol:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
+            b += 1
+
+    clusters = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    return [np.array(idx) for idx in clusters.values()]
+
+
+def numerical_nullspace(B, tol):
+    """Right singular vectors of B whose singular values are <= tol."""
+    _, s, vh = np.linalg.svd(B)
+    nullity = int(np.sum(s <= tol))
+    if nullity == 0:
+        return np.zeros((B.shape[1], 0), dtype=vh.dtype)
+    return vh[-nullity:].conj().T
+
+
+def choose_mode(A, max_dim=SYMBOLIC_MAX_DIM):
+    """
+    "symbolic" for small matrices of exact (integer/rational) entries,
+    "numeric" for anything larger or containing floating point entries.
+    """
+    if len(A) > max_dim:
+        return "numeric"
+    for row in A:
+        for x in row:
+            if isinstance(x, (float, complex, np.floating, np.complexfloating)):
+                return "numeric"
+            if getattr(x, "is_Float", False):
+                return "numeric"
+    return "symbolic"
+
+
+# ======== Main Function ========
+
+def numeric_eigen_data(A, tol=None, max_condition=DEFAULT_MAX_CONDITION):
+    """
+    A: array-like square matrix
+
+    tol is the absolute clustering / rank tolerance; by default it is
+    DEFAULT_CLUSTER_TOL scaled by the 2-norm of A. The matrix is reported
+    diagonalizable only if every cluster has geometric == algebraic
+    multiplicity *and* the eigenvector matrix P has condition number below
+    max_condition.
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    A_np = np.array(A, dtype=complex if np.iscomplexobj(A) else float)
+    n = A_np.shape[0]
+    if A_np.ndim != 2 or A_np.shape[1] != n:
+        raise ValueError("Matrix must be square")
+    scale = max(1.0, np.linalg.norm(A_np, 2)) if n else 1.0
+    if tol is None:
+        tol = DEFAULT_CLUSTER_TOL * scale
+    timings["matrix"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    w, v = _linalg.eig(A_np)
+    timings["eig"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clusters = cluster_eigenvalues(w, tol)
+    timings["cluster"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    identity = np.eye(n)
+    eigenvals = {}
+    eigenspaces = {}
+    for idx in clusters:
+        val = _scalar(w[idx].mean(), tol)
+        algebraic_multiplicity = len(idx)
+        if algebraic_multiplicity == 1:
+            # A simple eigenvalue always has a one-dimensional eigenspace
+            basis = v[:, idx]
+        else:
+            basis = numerical_nullspace(A_np - val * identity, tol)
+            basis = basis[:, :algebraic_multiplicity]
+        if isinstance(val, float) and np.allclose(basis.imag, 0, atol=tol):
+            basis = basis.real
+        eigenvals[val] = algebraic_multiplicity
+        eigenspaces[val] = {
+            "algebraic_multiplicity": algebraic_multiplicity,
+            "geometric_multiplicity": basis.shape[1],
+            "basis": [basis[:, k] for k in range(basis.shape[1])]
+        }
+    timings["rank"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    complete = all(
+        data["algebraic_multiplicity"] == data["geometric_multiplicity"]
+        for data in eigenspaces.values()
+    )
+    P, D, condition = None, None, (np.inf if n else 1.0)
+    if complete and n:
+        p_cols, diag = [], []
+        for val, data in eigenspaces.items():
+            diag += [val] * data["algebraic_multiplicity"]
+            p_cols += data["basis"]
+        P = np.column_stack(p_cols)
+        D = np.diag(diag)
+        condition = float(np.linalg.cond(P))
+    diagonalizable = complete and condition < max_condition
+    if not diagonalizable:
+        P, D = None, None
+    timings["derive"] = time.perf_counter() - start
+
+    return {
+        "eigenvalues": eigenvals,
+        "eigenspaces": eigenspaces,
+        "diagonalizable": diagonalizable,
+        "P": P,
+        "D": D,
+        "condition": condition,
+        "structure": None,
+        "timings": timings
+    }
+
+
+# ======== Batched Analysis over (N, n, n) Stacks ========
+
+NEAR_DEFECTIVE_CONDITION = 1e6
+
+
+def batch_dtype(n):
+    """Structured dtype of one analyze_matrices record for n×n matrices."""
+    return np.dtype([
+        ("eigenvalues", np.complex128, (n,)),
+        ("algebraic_multiplicity", np.int64, (n,)),
+        ("geometric_multiplicity", np.int64, (n,)),
+        ("diagonalizable", np.bool_),
+        ("near_defective", np.bool_),
+        ("condition", np.float64),
+        ("exact", np.bool_),
+    ])
+
+
+def batched_eigen_data(stack, tol=None, max_condition=DEFAULT_MAX_CONDITION):
+    """
+    stack: (N, n, n) array
+
+    One vectorized eigendecomposition for the whole stack; multiplicities
+    and the diagonalizability verdict are computed with array operations.
+    Multiplicities are reported per eigenvalue slot, so a double eigenvalue
+    appears twice with algebraic_multiplicity 2. Rows whose spectrum has
+    (near-)repeated eigenvalues or an ill-conditioned eigenvector matrix are
+    flagged near_defective.
+    """
+    stack = np.asarray(stack)
+    stack = stack.astype(complex if np.iscomplexobj(stack) else float)
+    if stack.ndim != 3 or stack.shape[1] != stack.shape[2]:
+        raise ValueError("Expected an (N, n, n) stack of square matrices")
+    N, n, _ = stack.shape
+
+    if tol is None:
+        scale = np.maximum(1.0, np.linalg.norm(stack, ord=2, axis=(1, 2)))
+        tol = DEFAULT_CLUSTER_TOL * scale
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), (N,))
+
+    w, v = np.linalg.eig(stack)
+
+    # close[k, i, j]: eigenvalues i and j of matrix k coincide within tol
+    close = np.abs(w[:, :, None] - w[:, None, :]) <= tol[:, None, None]
+    algebraic = close.sum(axis=-1)
+    geometric = np.ones_like(algebraic)
+
+    repeated = algebraic > 1
+    rows = np.flatnonzero(repeated.any(axis=1))
+    if rows.size:
+        # Nullity of (A - λI) for every eigenvalue slot of the flagged rows
+        shifted = stack[rows, None] - w[rows, :, None, None] * np.eye(n)
+        s = np.linalg.svd(shifted, compute_uv=False)
+        nullity = (s <= tol[rows, None, None]).sum(axis=-1)
+        geometric[rows] = np.where(repeated[rows], nullity, 1)
+    geometric = np.minimum(geometric, algebraic)
+
+    with np.errstate(all="ignore"):
+        condition = np.linalg.cond(v) if n else np.ones(N)
+    condition = np.where(np.isfinite(condition), condition, np.inf)
+
+    out = np.zeros(N, dtype=batch_dtype(n))
+    out["eigenvalues"] = w
+    out["algebraic_multiplicity"] = algebraic
+    out["geometric_multiplicity"] = geometric
+    out["condition"] = condition
+    out["diagonalizable"] = (geometric == algebraic).all(axis=1) & (condition < max_condition)
+    out["near_defective"] = repeated.any(axis=1) | (condition >= NEAR_DEFECTIVE_CONDITION)
+    return out
@@ -0,0 +1,187 @@
+"""
+Process-pool driver for symbolic eigen analysis with per-matrix timeouts.
+
+Some integer matrices (e.g. irreducible quintic charpolys) make SymPy run
+for minutes. analyze_many() spreads matrices over worker processes,
+deduplicates identical inputs, enforces a wall-clock timeout per matrix by
+killing and respawning the worker, and yields outcomes as they complete.
+"""
+
+import multiprocessing as mp
+import os
+import time
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from eigen_cache import matrix_key
+
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+@dataclass
+class AnalysisOutcome:
+    index: int                        # position in the input sequence
+    status: str                       # OK, TIMEOUT or ERROR
+    result: Optional[Dict[str, Any]]  # analyze_matrix dict (numeric fallback on TIMEOUT)
+    elapsed: float                    # wall-clock seconds spent on this matrix
+    error: Optional[str] = None
+
+
+# ======== Worker Side ========
+
+def _worker_main(conn):
+    from diagonlize import analyze_matrix
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+
+        key, matrix_tuple = task
+        start = time.perf_counter()
+        try:
+            result = dict(analyze_matrix(matrix_tuple))
+            conn.send((key, OK, result, time.perf_counter() - start, None))
+        except Exception:
+            conn.send((key, ERROR, None, time.perf_counter() - start, traceback.format_exc()))
+
+
+class _Worker:
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.key = None
+        self.started = None
+
+    def submit(self, key, matrix_tuple):
+        self.key = key
+        self.started = time.perf_counter()
+        self.conn.send((key, matrix_tuple))
+
+    def idle(self):
+        self.key = None
+        self.started = None
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+# ======== Driver ========
+
+def analyze_many(
+    matrices: Iterable,
+    timeout: float = 60.0,
+    workers: Optional[int] = None,
+    numeric_fallback: bool = False,
+) -> Iterator[AnalysisOutcome]:
+    """
+    Analyze every matrix with analyze_matrix in a pool of worker processes.
+
+    Identical matrices are dispatched once; every input index still gets its
+    own AnalysisOutcome. Outcomes are yielded in completion order. A matrix
+    that exceeds `timeout` seconds has its worker killed and replaced, and is
+    reported with status TIMEOUT; with numeric_fallback=True its result is
+    the numeric (LAPACK) analysis instead of None, or an ERROR outcome if
+    the matrix cannot be analyzed numerically.
+    """
+    from eigen_numeric import numeric_eigen_data
+
+    indices_by_key = {}
+    tuples_by_key = {}
+    order = []
+    for index, A in enumerate(matrices):
+        matrix_tuple = tuple(tuple(row) for row in A)
+        key = matrix_key(matrix_tuple)
+        if key not in indices_by_key:
+            indices_by_key[key] = []
+            tuples_by_key[key] = matrix_tuple
+            order.append(key)
+        indices_by_key[key].append(index)
+
+    if not order:
+        return
+
+    ctx = mp.get_context()
+    workers = min(workers or os.cpu_count() or 1, len(order))
+    pool = [_Worker(ctx) for _ in range(workers)]
+    queue = list(reversed(order))
+
+    def outcomes(key, status, result, elapsed, error=None):
+        for index in indices_by_key[key]:
+            yield AnalysisOutcome(index, status, result, elapsed, error)
+
+    try:
+        while True:
+            for worker in pool:
+                if worker.key is None and queue:
+                    key = queue.pop()
+                    worker.submit(key, tuples_by_key[key])
+
+            busy = [worker for worker in pool if worker.key is not None]
+            if not busy:
+                break
+
+            now = time.perf_counter()
+            remaining = min(worker.started + timeout - now for worker in busy)
+            ready = wait([worker.conn for worker in busy], timeout=max(0.0, remaining))
+
+            for i, worker in enumerate(pool):
+                if worker.key is None:
+                    continue
+
+                if worker.conn in ready:
+                    try:
+                        key, status, result, elapsed, error = worker.conn.recv()
+                    except EOFError:
+                        # The worker died (e.g. out of memory); replace it
+                        key, elapsed = worker.key, time.perf_counter() - worker.started
+                        worker.kill()
+                        pool[i] = _Worker(ctx)
+                        yield from outcomes(key, ERROR, None, elapsed, "worker process died")
+                        continue
+                    worker.idle()
+                    yield from outcomes(key, status, result, elapsed, error)
+
+                elif time.perf_counter() - worker.started >= timeout:
+                    key, elapsed = worker.key, time.perf_counter() - worker.started
+                    worker.kill()
+                    pool[i] = _Worker(ctx)
+                    if not numeric_fallback:
+                        yield from outcomes(key, TIMEOUT, None, elapsed)
+                        continue
+                    try:
+                        result = numeric_eigen_data(tuples_by_key[key])
+                    except Exception:
+                        # E.g. symbolic entries: report it like a worker failure
+                        yield from outcomes(key, ERROR, None, elapsed,
+                                            "timed out; numeric fallback failed:\n" + traceback.format_exc())
+                        continue
+                    yield from outcomes(key, TIMEOUT, result, elapsed)
+    finally:
+        for worker in pool:
+            if worker.key is None:
+                worker.stop()
+            else:
+                worker.kill()
@@ -0,0 +1,145 @@
+"""
+Structure detection for the eigen engine.
+
+Diagonal and triangular matrices have their eigenvalues on the diagonal,
+and a matrix whose sparsity graph splits into several connected components
+is permutation-similar to a block-diagonal matrix, so each block can be
+analysed on its own. These helpers classify a SymPy Matrix and provide
+the fast paths; diagonlize._eigen_engine does the dispatching.
+"""
+
+from sympy import Matrix, zeros
+from sympy.core.sorting import default_sort_key
+
+DIAGONAL = "diagonal"
+UPPER_TRIANGULAR = "upper_triangular"
+LOWER_TRIANGULAR = "lower_triangular"
+BLOCK_DIAGONAL = "block_diagonal"
+GENERAL = "general"
+
+
+# ======== Classification ========
+
+def sparsity_components(M):
+    """
+    Connected components of the undirected graph with an edge i - j whenever
+    M[i, j] or M[j, i] is nonzero. Each component is a sorted index list.
+    """
+    n = M.rows
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(n):
+        for j in range(n):
+            if i != j and M[i, j] != 0:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
+
+    components = {}
+    for i in range(n):
+        components.setdefault(find(i), []).append(i)
+    return sorted(components.values())
+
+
+def detect_structure(M):
+    """
+    Returns (kind, blocks). blocks is the list of component index lists
+    for BLOCK_DIAGONAL and None otherwise.
+    """
+    n = M.rows
+    upper = all(M[i, j] == 0 for i in range(n) for j in range(i))
+    lower = all(M[i, j] == 0 for i in range(n) for j in range(i + 1, n))
+
+    if upper and lower:
+        return DIAGONAL, None
+    if upper:
+        return UPPER_TRIANGULAR, None
+    if lower:
+        return LOWER_TRIANGULAR, None
+
+    blocks = sparsity_components(M)
+    if len(blocks) > 1:
+        return BLOCK_DIAGONAL, blocks
+    return GENERAL, None
+
+
+# ======== Fast Paths ========
+
+def diagonal_eigenvals(M):
+    """Eigenvalues of a triangular matrix, in order of first appearance."""
+    counts = {}
+    for i in range(M.rows):
+        val = M[i, i]
+        counts[val] = counts.get(val, 0) + 1
+    return counts
+
+
+def _sorted_eigenvects(eigvecs):
+    # Matrix.eigenvects() order, so P and D match Matrix.diagonalize()
+    return sorted(eigvecs, key=lambda item: default_sort_key(item[0]))
+
+
+def diagonal_eigenvects(M):
+    """Eigenvectors of a diagonal matrix are standard basis vectors."""
+    n = M.rows
+    result = []
+    for val, mult in diagonal_eigenvals(M).items():
+        basis = []
+        for i in range(n):
+            if M[i, i] == val:
+                e = zeros(n, 1)
+                e[i] = 1
+                basis.append(e)
+        result.append((val, mult, basis))
+    return _sorted_eigenvects(result)
+
+
+def triangular_eigenvects(M):
+    """
+    Eigenvalues are read off the diagonal (no charpoly); only the nullspace
+    of (M - λI) is computed for each distinct λ.
+    """
+    n = M.rows
+    result = []
+    for val, mult in diagonal_eigenvals(M).items():
+        basis = (M - val * Matrix.eye(n)).nullspace()
+        result.append((val, mult, basis))
+    return _sorted_eigenvects(result)
+
+
+def merge_block_eigenvals(block_results):
+    """Sum the multiplicities of per-block eigenvalue dicts."""
+    merged = {}
+    for eigenvals in block_results:
+        for val, mult in eigenvals.items():
+            merged[val] = merged.get(val, 0) + mult
+    return merged
+
+
+def merge_block_eigenvects(n, blocks, block_results):
+    """
+    Merge per-block eigenvects lists into one list for the full n×n matrix,
+    embedding each block's basis vectors at that block's indices. The
+    result is sorted like Matrix.eigenvects(), not in block order.
+    """
+    merged = {}
+    for indices, eigvecs in zip(blocks, block_results):
+        for val, mult, basis in eigvecs:
+            embedded = []
+            for v in basis:
+                full = zeros(n, 1)
+                for k, i in enumerate(indices):
+                    full[i] = v[k]
+                embedded.append(full)
+            if val in merged:
+                merged[val][0] += mult
+                merged[val][1] += embedded
+            else:
+                merged[val] = [mult, embedded]
+    return _sorted_eigenvects((val, mult, basis) for val, (mult, basis) in merged.items())
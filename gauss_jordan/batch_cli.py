@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Non-interactive batch front end for solve_linear_system.
+
+Reads many systems from files or stdin and streams one JSON line per
+system to the output as soon as it is solved; inputs are read
+incrementally, never loaded whole.
+
+Input formats:
+  jsonl  one object per line: {"A": [[...], ...], "b": [...], "id": ...}
+         ("id" is optional and defaults to the running system number)
+  csv    augmented rows "a_1,...,a_n,b"; systems separated by blank lines
+  npz    arrays "A" (k, n, n) and "b" (k, n), read one system at a time
+
+A malformed record (bad JSON, missing fields, non-numeric CSV cells) or a
+system the solver rejects produces {"id": ..., "error": ...} and the batch
+carries on.
+
+Examples:
+  python batch_cli.py systems.jsonl
+  cat systems.jsonl | python batch_cli.py --workers 8 > solutions.jsonl
+  python batch_cli.py blocks.csv stack.npz --backend fraction -o out.jsonl
+"""
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+import zipfile
+from collections import deque
+from fractions import Fraction
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from gauss_jordan import BACKENDS, EXACT_BACKENDS, solve_linear_system
+
+FORMATS = ("jsonl", "csv", "npz")
+_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl", ".csv": "csv", ".npz": "npz"}
+
+# Systems sent to a worker per task, and tasks in flight per worker; the
+# window bounds memory when the input is huge
+CHUNK_SIZE = 64
+CHUNKS_PER_WORKER = 4
+
+System = Tuple[Any, List[List[float]], List[float]]  # (id, A, b)
+
+
+class InputError(NamedTuple):
+    # A record that could not be parsed; it keeps its place in the numbering
+    id: Any
+    error: str
+
+
+# ======== Readers ========
+# Readers number the records they yield (not the input lines), so ids stay
+# unique when read_systems chains several inputs.
+
+def read_jsonl(stream: Iterable[str], start: int = 0) -> Iterator[Union[System, InputError]]:
+    number = start
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield InputError(number, f"Invalid JSON: {e}")
+        else:
+            if isinstance(record, dict) and "A" in record and "b" in record:
+                yield record.get("id", number), record["A"], record["b"]
+            else:
+                system_id = record.get("id", number) if isinstance(record, dict) else number
+                yield InputError(system_id, 'Expected an object with "A" and "b"')
+        number += 1
+
+
+def read_csv_blocks(stream: Iterable[str], start: int = 0) -> Iterator[Union[System, InputError]]:
+    number = start
+    block = []
+    error = None
+    for row in csv.reader(stream):
+        if not row or not any(cell.strip() for cell in row):
+            if block or error:
+                yield InputError(number, error) if error else (number, [r[:-1] for r in block], [r[-1] for r in block])
+                number += 1
+                block = []
+                error = None
+            continue
+        try:
+            block.append([float(cell) for cell in row])
+        except ValueError as e:
+            # Skip the rest of this block but keep reading the next ones
+            error = error or f"Invalid CSV row: {e}"
+    if block or error:
+        yield InputError(number, error) if error else (number, [r[:-1] for r in block], [r[-1] for r in block])
+
+
+def _npy_member(archive: zipfile.ZipFile, name: str):
+    # Open one .npy member and position it right after its header
+    import numpy as np
+
+    f = archive.open(name + ".npy")
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    if fortran_order:
+        raise ValueError(f"{name} must be stored in C order to be streamed")
+    return f, shape, dtype
+
+
+def read_npz(path, start: int = 0) -> Iterator[System]:
+    import numpy as np
+
+    with zipfile.ZipFile(path) as archive:
+        fa, shape_a, dtype_a = _npy_member(archive, "A")
+        fb, shape_b, dtype_b = _npy_member(archive, "b")
+        with fa, fb:
+            if len(shape_a) != 3 or shape_b[:1] != shape_a[:1]:
+                raise ValueError(f"Expected A of shape (k, m, n) and b of shape (k, m), got {shape_a} and {shape_b}")
+            k, m, n = shape_a
+            size_a = m * n * dtype_a.itemsize
+            size_b = m * dtype_b.itemsize
+            for i in range(k):
+                A = np.frombuffer(fa.read(size_a), dtype=dtype_a).reshape(m, n)
+                b = np.frombuffer(fb.read(size_b), dtype=dtype_b)
+                yield start + i, A.tolist(), b.tolist()
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _EXTENSIONS:
+        raise ValueError(f"Cannot infer the format of {path}; use --format")
+    return _EXTENSIONS[ext]
+
+
+def read_systems(paths: List[str], fmt: Optional[str] = None) -> Iterator[Union[System, InputError]]:
+    """Chain the systems of every input ("-" is stdin), numbering them globally."""
+    number = 0
+    for path in paths or ["-"]:
+        kind = fmt or ("jsonl" if path == "-" else detect_format(path))
+        if kind == "npz":
+            # Zip archives need a seekable file, so stdin is buffered first
+            source = io.BytesIO(sys.stdin.buffer.read()) if path == "-" else path
+            for system in read_npz(source, number):
+                number += 1
+                yield system
+            continue
+
+        reader = read_jsonl if kind == "jsonl" else read_csv_blocks
+        stream = sys.stdin if path == "-" else open(path, newline="")
+        try:
+            for system in reader(stream, number):
+                number += 1
+                yield system
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+# ======== Solving ========
+
+def _to_json(value, exact: bool):
+    # Fractions become "p/q" strings so exact results survive JSON
+    return str(Fraction(value)) if exact else float(value)
+
+
+def _is_entry(x, exact: bool) -> bool:
+    # Numbers, and for exact backends also "p/q" strings (as written by this tool)
+    if isinstance(x, bool):
+        return False
+    if isinstance(x, (int, float)):
+        return True
+    if exact and isinstance(x, str):
+        try:
+            Fraction(x)
+        except ValueError:
+            return False
+        return True
+    return False
+
+
+def check_system(A, b, exact: bool = False) -> Optional[str]:
+    """Why A, b is not a well-formed system, or None if it is."""
+    if not isinstance(A, list) or not A or not all(isinstance(row, list) for row in A):
+        return "A must be a non-empty list of rows"
+    n = len(A[0])
+    if n == 0 or any(len(row) != n for row in A):
+        return "Rows of A must be non-empty and of equal length"
+    if not isinstance(b, list) or len(b) != len(A):
+        return "b must be a list with one entry per row of A"
+    if not all(_is_entry(x, exact) for row in A for x in row) or not all(_is_entry(x, exact) for x in b):
+        return "Entries of A and b must be numbers"
+    return None
+
+
+def solve_record(system: Union[System, InputError], backend: str = "auto") -> Dict[str, Any]:
+    if isinstance(system, InputError):
+        return {"id": system.id, "error": system.error}
+    system_id, A, b = system
+    exact = backend in EXACT_BACKENDS
+    error = check_system(A, b, exact)
+    if error is not None:
+        return {"id": system_id, "error": error}
+    solution, steps = solve_linear_system(A, b, backend=backend, trace="none")
+    if solution is not None:
+        return {"id": system_id, "solution": [_to_json(x, exact) for x in solution]}
+    if isinstance(steps, list) and steps and steps[0].startswith("Error: "):
+        # solve_linear_system reports a rejected system as ["Error: ..."]
+        return {"id": system_id, "error": steps[0][len("Error: "):]}
+    return {"id": system_id, "solution": None, "message": steps[-1] if len(steps) else "No solution"}
+
+
+def solve_chunk(chunk: List[Union[System, InputError]], backend: str = "auto") -> List[Dict[str, Any]]:
+    return [solve_record(system, backend) for system in chunk]
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bounded_imap(pool, func, items: Iterable, window: int) -> Iterator:
+    # Ordered like Pool.imap, but never reads more than `window` items ahead
+    pending = deque()
+    for item in items:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def solve_stream(systems: Iterable[Union[System, InputError]], backend: str = "auto", workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """Solve systems in input order, in a pool of `workers` processes when > 1."""
+    if workers <= 1:
+        yield from map(partial(solve_record, backend=backend), systems)
+        return
+    with mp.get_context().Pool(workers) as pool:
+        func = partial(solve_chunk, backend=backend)
+        for results in _bounded_imap(pool, func, _chunks(systems, CHUNK_SIZE), workers * CHUNKS_PER_WORKER):
+            yield from results
+
+
+# ======== Entry Point ========
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solve many linear systems and stream the solutions as JSON lines.",
+    )
+    parser.add_argument("inputs", nargs="*", help="input files; '-' or nothing reads stdin")
+    parser.add_argument("--format", choices=FORMATS, help="input format (default: from the file extension, jsonl on stdin)")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0 = one per CPU)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--quiet", action="store_true", help="do not print the summary to stderr")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    solved = total = errors = 0
+    start = time.perf_counter()
+    try:
+        for result in solve_stream(read_systems(args.inputs, args.format), args.backend, workers):
+            out.write(json.dumps(result) + "\n")
+            out.flush()  # stream results even when the output is a pipe
+            total += 1
+            solved += result.get("solution") is not None
+            errors += "error" in result
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    if not args.quiet:
+        rate = total / elapsed if elapsed else 0.0
+        print(
+            f"{total} systems ({solved} with a unique solution, {errors} errors) in {elapsed:.2f} s: {rate:.1f} systems/s",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
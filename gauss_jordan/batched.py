@@ -0,0 +1,169 @@
+"""
+Batched solver for many small systems.
+
+solve_batched(A, b) takes a coefficient stack A of shape (N, n, n) and a
+constants stack b of shape (N, n) and solves every system in one vectorized
+pass, with no per-system Python work:
+
+- n <= 4: closed-form adjugate kernels, x = adj(A) b / det(A), written out
+  entry by entry so each step is one elementwise operation over the batch
+  (stored batch-last, so each operand is a contiguous vector).
+- n > 4: Gauss-Jordan with partial pivoting, one pivot step at a time for
+  the whole batch.
+
+Instead of step strings every system gets a status code. Systems flagged
+singular are classified as INFINITE or INCONSISTENT by comparing rank(A)
+with rank([A|b]), on that subset only.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Status codes
+OK = 0            # unique solution
+INFINITE = 1      # singular, consistent: infinitely many solutions
+INCONSISTENT = 2  # singular, inconsistent: no solution
+
+# |det A| <= SINGULAR_RTOL * prod_i ||row_i|| counts as singular
+SINGULAR_RTOL = 1e-12
+
+# Largest n handled by the closed-form kernels
+CLOSED_FORM_MAX = 4
+
+
+# ======== Closed-Form Kernels ========
+# Kernels take a = A.transpose(1, 2, 0) and bt = b.T (batch axis last,
+# contiguous), so every a[i][j] is one contiguous vector over the batch.
+# They return det (N,) and x (n, N), with x already divided by det.
+
+def _kernel_1(a, bt):
+    return a[0, 0], bt / a[0, 0]
+
+
+def _kernel_2(a, bt):
+    det = a[0, 0] * a[1, 1] - a[0, 1] * a[1, 0]
+    x = np.stack([a[1, 1] * bt[0] - a[0, 1] * bt[1], a[0, 0] * bt[1] - a[1, 0] * bt[0]])
+    return det, x / det
+
+
+def _kernel_3(a, bt):
+    # The columns of adj(A) are the cross products of the rows of A
+    c0 = [a[1, 1] * a[2, 2] - a[1, 2] * a[2, 1], a[1, 2] * a[2, 0] - a[1, 0] * a[2, 2], a[1, 0] * a[2, 1] - a[1, 1] * a[2, 0]]
+    c1 = [a[2, 1] * a[0, 2] - a[2, 2] * a[0, 1], a[2, 2] * a[0, 0] - a[2, 0] * a[0, 2], a[2, 0] * a[0, 1] - a[2, 1] * a[0, 0]]
+    c2 = [a[0, 1] * a[1, 2] - a[0, 2] * a[1, 1], a[0, 2] * a[1, 0] - a[0, 0] * a[1, 2], a[0, 0] * a[1, 1] - a[0, 1] * a[1, 0]]
+    det = a[0, 0] * c0[0] + a[0, 1] * c0[1] + a[0, 2] * c0[2]
+    x = np.stack([c0[i] * bt[0] + c1[i] * bt[1] + c2[i] * bt[2] for i in range(3)])
+    return det, x / det
+
+
+def _kernel_4(a, bt):
+    # Laplace expansion along the first two rows: 2x2 minors s of rows 0-1
+    # and c of rows 2-3 give det(A) and every cofactor
+    s0 = a[0, 0] * a[1, 1] - a[1, 0] * a[0, 1]
+    s1 = a[0, 0] * a[1, 2] - a[1, 0] * a[0, 2]
+    s2 = a[0, 0] * a[1, 3] - a[1, 0] * a[0, 3]
+    s3 = a[0, 1] * a[1, 2] - a[1, 1] * a[0, 2]
+    s4 = a[0, 1] * a[1, 3] - a[1, 1] * a[0, 3]
+    s5 = a[0, 2] * a[1, 3] - a[1, 2] * a[0, 3]
+    c5 = a[2, 2] * a[3, 3] - a[3, 2] * a[2, 3]
+    c4 = a[2, 1] * a[3, 3] - a[3, 1] * a[2, 3]
+    c3 = a[2, 1] * a[3, 2] - a[3, 1] * a[2, 2]
+    c2 = a[2, 0] * a[3, 3] - a[3, 0] * a[2, 3]
+    c1 = a[2, 0] * a[3, 2] - a[3, 0] * a[2, 2]
+    c0 = a[2, 0] * a[3, 1] - a[3, 0] * a[2, 1]
+    det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+    adj = [
+        [a[1, 1] * c5 - a[1, 2] * c4 + a[1, 3] * c3, -a[0, 1] * c5 + a[0, 2] * c4 - a[0, 3] * c3,
+         a[3, 1] * s5 - a[3, 2] * s4 + a[3, 3] * s3, -a[2, 1] * s5 + a[2, 2] * s4 - a[2, 3] * s3],
+        [-a[1, 0] * c5 + a[1, 2] * c2 - a[1, 3] * c1, a[0, 0] * c5 - a[0, 2] * c2 + a[0, 3] * c1,
+         -a[3, 0] * s5 + a[3, 2] * s2 - a[3, 3] * s1, a[2, 0] * s5 - a[2, 2] * s2 + a[2, 3] * s1],
+        [a[1, 0] * c4 - a[1, 1] * c2 + a[1, 3] * c0, -a[0, 0] * c4 + a[0, 1] * c2 - a[0, 3] * c0,
+         a[3, 0] * s4 - a[3, 1] * s2 + a[3, 3] * s0, -a[2, 0] * s4 + a[2, 1] * s2 - a[2, 3] * s0],
+        [-a[1, 0] * c3 + a[1, 1] * c1 - a[1, 2] * c0, a[0, 0] * c3 - a[0, 1] * c1 + a[0, 2] * c0,
+         -a[3, 0] * s3 + a[3, 1] * s1 - a[3, 2] * s0, a[2, 0] * s3 - a[2, 1] * s1 + a[2, 2] * s0],
+    ]
+    x = np.stack([adj[i][0] * bt[0] + adj[i][1] * bt[1] + adj[i][2] * bt[2] + adj[i][3] * bt[3] for i in range(4)])
+    return det, x / det
+
+
+_KERNELS = {1: _kernel_1, 2: _kernel_2, 3: _kernel_3, 4: _kernel_4}
+
+
+# ======== Batched Elimination ========
+
+def _eliminate_batched(A, b) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gauss-Jordan with partial pivoting on the whole stack at once, batch
+    axis last. Returns (x, singular) with singular[k] set when system k had
+    a pivot below SINGULAR_RTOL times its largest row norm.
+    """
+    N, n, _ = A.shape
+    aug = np.ascontiguousarray(np.concatenate([A, b[:, :, None]], axis=2).transpose(1, 2, 0))
+    batch = np.arange(N)
+    threshold = SINGULAR_RTOL * np.linalg.norm(A, axis=2).max(axis=1)
+    singular = np.zeros(N, dtype=bool)
+
+    for k in range(n):
+        p = k + np.argmax(np.abs(aug[k:, k]), axis=0)
+        swap = p != k
+        if swap.any():
+            cols = batch[swap]
+            rows = aug[p[swap], :, cols]
+            aug[p[swap], :, cols] = aug[k, :, cols]
+            aug[k, :, cols] = rows
+
+        pivot = aug[k, k].copy()
+        small = np.abs(pivot) <= threshold
+        singular |= small
+        pivot[small] = 1.0  # keep going; these systems are reclassified later
+        aug[k] /= pivot
+
+        factors = aug[:, k].copy()
+        factors[k] = 0.0
+        aug -= factors[:, None, :] * aug[k]
+
+    return aug[:, n].T.copy(), singular
+
+
+# ======== Entry Point ========
+
+def _classify(A, b) -> np.ndarray:
+    # INFINITE where rank(A) == rank([A|b]), INCONSISTENT otherwise
+    rank_a = np.linalg.matrix_rank(A)
+    rank_ab = np.linalg.matrix_rank(np.concatenate([A, b[:, :, None]], axis=2))
+    return np.where(rank_a == rank_ab, INFINITE, INCONSISTENT).astype(np.uint8)
+
+
+def solve_batched(coefficients, constants) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve A[k] x[k] = b[k] for every k.
+
+    coefficients: (N, n, n), constants: (N, n). Returns (x, status) with x
+    of shape (N, n) (NaN rows where there is no unique solution) and status
+    of shape (N,) holding OK, INFINITE or INCONSISTENT.
+    """
+    A = np.asarray(coefficients, dtype=float)
+    b = np.asarray(constants, dtype=float)
+    if A.ndim != 3 or A.shape[1] != A.shape[2] or b.shape != A.shape[:2]:
+        raise ValueError(f"Expected coefficients of shape (N, n, n) and constants (N, n), got {A.shape} and {b.shape}")
+    N, n, _ = A.shape
+    if N == 0 or n == 0:
+        return np.empty((N, n)), np.full(N, OK, dtype=np.uint8)
+
+    if n <= CLOSED_FORM_MAX:
+        a = np.ascontiguousarray(A.transpose(1, 2, 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            det, x = _KERNELS[n](a, np.ascontiguousarray(b.T))
+        scale = np.sqrt((a * a).sum(axis=1)).prod(axis=0)
+        singular = ~(np.abs(det) > SINGULAR_RTOL * scale)
+        x = x.T.copy()
+    else:
+        x, singular = _eliminate_batched(A, b)
+
+    status = np.full(N, OK, dtype=np.uint8)
+    if singular.any():
+        status[singular] = _classify(A[singular], b[singular])
+        x[singular] = np.nan
+    return x, status
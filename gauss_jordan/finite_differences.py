@@ -0,0 +1,115 @@
+"""
+Finite-difference derivatives from a single batch of stencil points.
+
+derivatives(f, x) builds every point the central-difference gradient and
+Hessian need as one (k, n) array, with one step h_i per coordinate:
+
+    x                          1 point, f(x), shared by all formulas
+    x +- h_i e_i               2n points, the gradient and the Hessian diagonal
+    x +- h_i e_i +- h_j e_j    4 points per pair i > j, the mixed partials
+
+so k = 2n^2 + 1. A vectorized f, mapping a (k, n) array to k values, is then
+called exactly once per evaluation; a scalar f is called once per row.
+
+The step h_i = eps^(1/3) max(1, |x_i|) is the optimal one for the central
+gradient, which decides where an iteration stops. Second differences would
+prefer eps^(1/4); at the shared step their rounding error grows to about
+eps^(1/3) relative, which only slows Newton's convergence, in exchange for
+reusing the 2n gradient points instead of evaluating 2n more.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+_EPS = float(np.finfo(float).eps)
+STEP = _EPS ** (1 / 3)
+
+
+@dataclass
+class Derivatives:
+    fun: float
+    grad: np.ndarray
+    hess: Optional[np.ndarray]
+    evaluations: int  # stencil points evaluated
+
+
+def step_sizes(x: np.ndarray) -> np.ndarray:
+    """Per-coordinate steps, rounded so that x + h is exactly representable."""
+    h = STEP * np.maximum(1.0, np.abs(x))
+    return (x + h) - x
+
+
+def stencil(x: np.ndarray, h: np.ndarray, hessian: bool = True) -> np.ndarray:
+    """
+    All stencil points as rows of one (k, n) array, in the order above; the
+    mixed points are left out when hessian is False.
+    """
+    n = len(x)
+    i, j = np.tril_indices(n if hessian else 0, -1)
+    m = len(i)
+    points = np.tile(x, (1 + 2 * n + 4 * m, 1))
+
+    coords = np.arange(n)
+    points[1 + coords, coords] += h
+    points[1 + n + coords, coords] -= h
+
+    if m:
+        pairs = np.arange(m)
+        for s, (si, sj) in enumerate(((1, 1), (1, -1), (-1, 1), (-1, -1))):
+            rows = 1 + 2 * n + s * m + pairs
+            points[rows, i] += si * h[i]
+            points[rows, j] += sj * h[j]
+    return points
+
+
+def evaluate(f: Callable, points: np.ndarray, vectorized: bool = False) -> np.ndarray:
+    """f at every row of points: one call if vectorized, else one per row."""
+    if vectorized:
+        values = np.asarray(f(points), dtype=float).reshape(-1)
+        if values.shape != (len(points),):
+            raise ValueError(f"A vectorized f must map ({len(points)}, n) points to {len(points)} values")
+        return values
+    return np.array([f(p) for p in points], dtype=float)
+
+
+def derivatives(
+    f: Callable,
+    x,
+    hessian: bool = True,
+    vectorized: bool = False,
+    h: Union[None, float, np.ndarray] = None,
+) -> Derivatives:
+    """
+    f(x), the central-difference gradient and (if hessian) the Hessian from
+    one batch of points. h overrides the adaptive steps (scalar or per
+    coordinate).
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if h is None:
+        h = step_sizes(x)
+    else:
+        h = np.broadcast_to(np.asarray(h, dtype=float), (n,))
+
+    points = stencil(x, h, hessian)
+    values = evaluate(f, points, vectorized)
+
+    f0 = values[0]
+    fp = values[1:1 + n]
+    fm = values[1 + n:1 + 2 * n]
+    grad = (fp - fm) / (2 * h)
+    if not hessian:
+        return Derivatives(f0, grad, None, len(points))
+
+    H = np.empty((n, n))
+    H[np.diag_indices(n)] = (fp - 2 * f0 + fm) / h**2
+    i, j = np.tril_indices(n, -1)
+    m = len(i)
+    vpp, vpm, vmp, vmm = values[1 + 2 * n:].reshape(4, m)
+    # Mixed partial derivatives
+    mixed = (vpp - vpm - vmp + vmm) / (4 * h[i] * h[j])
+    H[i, j] = mixed
+    H[j, i] = mixed
+    return Derivatives(f0, grad, H, len(points))
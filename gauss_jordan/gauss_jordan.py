@@ -3,75 +3,586 @@
 Gauss-Jordan Elimination Solver
 """
 
-from typing import List, Tuple, Optional
+import os
+from fractions import Fraction
+from math import lcm
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union, overload
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python backend needs nothing
+    np = None
+
+if np is not None:
+    from iterative import METHODS as ITERATIVE_METHODS, as_operator, choose_method, solve_iterative
+    from mixed_precision import solve_mixed
+    from out_of_core import factorize_out_of_core, is_out_of_core
+else:  # memmaps need NumPy anyway
+    ITERATIVE_METHODS = ()
+
+    def is_out_of_core(matrix) -> bool:
+        return False
+from sparse_elimination import is_sparse, sparse_factorize
+
+BACKENDS = ("auto", "python", "numpy", "fraction", "bareiss")
+EXACT_BACKENDS = ("fraction", "bareiss")
+SOLVE_METHODS = ("direct", "auto", "jacobi", "gauss_seidel", "sor", "cg", "gmres")
+PRECISIONS = ("double", "mixed")
+TRACE_LEVELS = ("none", "ops", "full")
+
+# Below this size the per-call overhead of NumPy outweighs the vectorization
+NUMPY_MIN_SIZE = 16
 
 
 def format_matrix(matrix: List[List[float]]) -> str:
     lines = []
     for row in matrix:
-        line = "[" + " ".join(f"{x:8.3f}" for x in row) + "]"
+        line = "[" + " ".join(f"{float(x):8.3f}" for x in row) + "]"
         lines.append(line)
     return "\n".join(lines)
 
 
-def gauss_jordan_elimination(matrix: List[List[float]]) -> Tuple[List[List[float]], List[str]]:
-    steps = []
-    n = len(matrix)
-    m = len(matrix[0]) - 1
-    
-    augmented_matrix = [row[:] for row in matrix]
-    
-    steps.append("Starting Gauss-Jordan elimination:")
-    steps.append(f"System has {n} equations and {m} variables")
-    steps.append(f"Initial augmented matrix:")
-    steps.append(format_matrix(augmented_matrix))
-    
-    for i in range(n):
-        # Find largest pivot in column i
+# ======== Step Trace ========
+
+class TraceStep(NamedTuple):
+    op: str            # "swap", "zero_pivot", "scale", "eliminate", "matrix", ...
+    row_i: int = -1    # 0-based row the operation writes to
+    row_j: int = -1    # 0-based source row (swap partner / pivot row)
+    factor: float = 0.0
+    data: Any = None   # matrix snapshot, note text or solution vector
+
+
+def render_step(step: TraceStep) -> str:
+    op, i, j, factor, data = step
+    if op == "swap":
+        return f"Swapped row {i+1} with row {j+1}"
+    if op == "zero_pivot":
+        return f"Warning: Pivot at position ({i+1},{j+1}) is very small or zero"
+    if op == "scale":
+        return f"Row {i+1} divided by {float(factor):.3f} to make pivot = 1"
+    if op == "eliminate":
+        return f"Row {i+1} = Row {i+1} - ({float(factor):.3f}) * Row {j+1}"
+    if op == "fraction_free":
+        pivot, previous = data
+        return f"Row {i+1} = ({pivot} * Row {i+1} - ({factor}) * Row {j+1}) / {previous}"
+    if op == "after":
+        return f"After eliminating variable x{i+1}:"
+    if op == "matrix":
+        return format_matrix(data)
+    if op == "system":
+        return f"System has {i} equations and {j} variables"
+    if op == "inconsistent":
+        return "System is inconsistent - no solution exists"
+    if op == "infinite":
+        return f"System has infinite solutions (rank = {i} < {j})"
+    if op in ("fill", "io", "iterative", "mixed"):
+        return str(data)
+    if op == "singular":
+        return "Coefficient matrix is singular - no unique solution exists"
+    if op == "solution":
+        return f"Solution found: {[f'{float(x):.6f}' for x in data]}"
+    return str(data)
+
+
+class StepTrace(Sequence):
+    """
+    Elimination steps stored as compact TraceStep records and formatted
+    into text only when read. It behaves like the old list of strings.
+
+    level "none" records no elimination steps at all, "ops" records the row
+    operations only, and "full" also keeps a matrix snapshot after every
+    pivot.
+    """
+
+    def __init__(self, level: str = "full"):
+        if level not in TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level: {level}")
+        self.level = level
+        self.ops = level != "none"
+        self.full = level == "full"
+        self.records: List[TraceStep] = []
+
+    def record(self, op: str, row_i: int = -1, row_j: int = -1, factor: float = 0.0, data: Any = None):
+        self.records.append(TraceStep(op, row_i, row_j, factor, data))
+
+    def append(self, text: str):
+        # Free-form messages, kept for callers that treat steps as a list
+        self.records.append(TraceStep("note", data=text))
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [render_step(step) for step in self.records[index]]
+        return render_step(self.records[index])
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[str]:
+        return (render_step(step) for step in self.records)
+
+    def render(self) -> List[str]:
+        return list(self)
+
+
+# ======== Elimination Backends ========
+
+def _choose_backend(matrix: List[List[float]]) -> str:
+    if np is None or len(matrix) < NUMPY_MIN_SIZE:
+        return "python"
+    if all(isinstance(x, (int, float)) for row in matrix for x in row):
+        return "numpy"
+    return "python"
+
+
+def _eliminate_python(augmented_matrix: List[List[float]], trace: StepTrace, n_cols: int, tol: float = 1e-10) -> Tuple[List[List[float]], List[int]]:
+    # Column-advancing: a column without a usable pivot keeps the current
+    # row for the next column. tol = 0 gives exact zero tests for Fractions.
+    n = len(augmented_matrix)
+    ops, full = trace.ops, trace.full
+    pivot_columns = []
+    i = 0
+
+    for col in range(n_cols):
+        if i == n:
+            break
+        
+        # Find largest pivot in this column
         max_row = i
         for k in range(i + 1, n):
-            if abs(augmented_matrix[k][i]) > abs(augmented_matrix[max_row][i]):
+            if abs(augmented_matrix[k][col]) > abs(augmented_matrix[max_row][col]):
                 max_row = k
         
         if max_row != i:
             augmented_matrix[i], augmented_matrix[max_row] = augmented_matrix[max_row], augmented_matrix[i]
-            steps.append(f"Swapped row {i+1} with row {max_row+1}")
+            if ops:
+                trace.record("swap", i, max_row)
         
         # Skip if pivot is zero (inconsistent/infinite solutions)
-        if abs(augmented_matrix[i][i]) < 1e-10:
-            steps.append(f"Warning: Pivot at position ({i+1},{i+1}) is very small or zero")
+        if abs(augmented_matrix[i][col]) < tol or augmented_matrix[i][col] == 0:
+            if ops:
+                trace.record("zero_pivot", i, col)
             continue
         
         # Normalize pivot to 1
-        if augmented_matrix[i][i] != 1:
-            pivot = augmented_matrix[i][i]
+        if augmented_matrix[i][col] != 1:
+            pivot = augmented_matrix[i][col]
             for j in range(len(augmented_matrix[i])):
                 augmented_matrix[i][j] /= pivot
-            steps.append(f"Row {i+1} divided by {pivot:.3f} to make pivot = 1")
+            if ops:
+                trace.record("scale", i, factor=pivot)
         
-        # Eliminate variable i from all other rows
+        # Eliminate this variable from all other rows
         for j in range(n):
             if i != j:
-                factor = augmented_matrix[j][i]
-                if abs(factor) > 1e-10:
+                factor = augmented_matrix[j][col]
+                if abs(factor) > tol:
                     for k in range(len(augmented_matrix[j])):
                         augmented_matrix[j][k] -= factor * augmented_matrix[i][k]
-                    steps.append(f"Row {j+1} = Row {j+1} - ({factor:.3f}) * Row {i+1}")
+                    if ops:
+                        trace.record("eliminate", j, i, factor)
+        
+        if full:
+            trace.record("after", col)
+            trace.record("matrix", data=[row[:] for row in augmented_matrix])
+        pivot_columns.append(col)
+        i += 1
+    
+    return augmented_matrix, pivot_columns
+
+
+def _eliminate_numpy(matrix: List[List[float]], trace: StepTrace, n_cols: int) -> Tuple[List[List[float]], List[int]]:
+    # Same pivoting and tolerances as _eliminate_python, but every pivot step
+    # is a handful of whole-array operations
+    a = np.array(matrix, dtype=float)
+    n = a.shape[0]
+    ops, full = trace.ops, trace.full
+    pivot_columns = []
+    i = 0
+
+    for col in range(n_cols):
+        if i == n:
+            break
+        
+        max_row = i + int(np.argmax(np.abs(a[i:, col])))
+        
+        if max_row != i:
+            a[[i, max_row]] = a[[max_row, i]]
+            if ops:
+                trace.record("swap", i, max_row)
+        
+        if abs(a[i, col]) < 1e-10:
+            if ops:
+                trace.record("zero_pivot", i, col)
+            continue
+        
+        if a[i, col] != 1:
+            pivot = float(a[i, col])
+            a[i] /= pivot
+            if ops:
+                trace.record("scale", i, factor=pivot)
+        
+        # Outer-product update of every row with a nonzero entry in this column
+        factors = a[:, col].copy()
+        factors[i] = 0.0
+        rows = np.flatnonzero(np.abs(factors) > 1e-10)
+        if rows.size:
+            a[rows] -= np.outer(factors[rows], a[i])
+            if ops:
+                for j, factor in zip(rows.tolist(), factors[rows].tolist()):
+                    trace.record("eliminate", j, i, factor)
+        
+        if full:
+            trace.record("after", col)
+            trace.record("matrix", data=a.tolist())
+        pivot_columns.append(col)
+        i += 1
+    
+    return a.tolist(), pivot_columns
+
+
+def _to_fractions(matrix: List[List[float]]) -> List[List[Fraction]]:
+    # Fraction(float) is exact, so no information is lost converting floats
+    return [[Fraction(x) for x in row] for row in matrix]
+
+
+def _eliminate_bareiss(matrix: List[List[float]], trace: StepTrace, n_cols: int) -> Tuple[List[List[Fraction]], List[int]]:
+    """
+    Fraction-free (Bareiss) Gauss-Jordan over the integers.
+
+    Every row is first scaled to integers. After the k-th pivot each entry
+    is a k x k minor of the input, so the division by the previous pivot
+    is exact and entries stay bounded by Hadamard's bound instead of
+    growing like products of fractions. Rows are divided by their pivots
+    only at the very end.
+    """
+    a = []
+    for row in _to_fractions(matrix):
+        scale = lcm(*(x.denominator for x in row))
+        a.append([int(x * scale) for x in row])
+
+    n = len(a)
+    ops, full = trace.ops, trace.full
+    previous = 1
+    pivot_columns = []
+    i = 0
+
+    for col in range(n_cols):
+        if i == n:
+            break
+        
+        # Same partial pivoting as the other backends
+        max_row = i
+        for k in range(i + 1, n):
+            if abs(a[k][col]) > abs(a[max_row][col]):
+                max_row = k
+        
+        if max_row != i:
+            a[i], a[max_row] = a[max_row], a[i]
+            if ops:
+                trace.record("swap", i, max_row)
+        
+        pivot = a[i][col]
+        if pivot == 0:
+            if ops:
+                trace.record("zero_pivot", i, col)
+            continue
+        
+        pivot_row = a[i]
+        for j in range(n):
+            if i != j:
+                factor = a[j][col]
+                row = a[j]
+                for k in range(len(row)):
+                    row[k] = (pivot * row[k] - factor * pivot_row[k]) // previous
+                if ops:
+                    trace.record("fraction_free", j, i, factor, (pivot, previous))
+        previous = pivot
         
-        steps.append(f"After eliminating variable x{i+1}:")
-        steps.append(format_matrix(augmented_matrix))
+        if full:
+            trace.record("after", col)
+            trace.record("matrix", data=[row[:] for row in a])
+        pivot_columns.append(col)
+        i += 1
     
-    return augmented_matrix, steps
+    # Normalize pivots to 1 only now, exactly
+    result = []
+    for i, row in enumerate(a):
+        pivot = row[pivot_columns[i]] if i < len(pivot_columns) else 0
+        if pivot not in (0, 1):
+            row = [Fraction(x, pivot) for x in row]
+            if ops:
+                trace.record("scale", i, factor=pivot)
+        else:
+            row = [Fraction(x) for x in row]
+        result.append(row)
+    return result, pivot_columns
 
 
-def solve_linear_system(coefficients: List[List[float]], constants: List[float]) -> Tuple[Optional[List[float]], List[str]]:
+def _gauss_jordan(matrix: List[List[float]], backend: str, trace: str, n_cols: int) -> Tuple[List[List[float]], List[int], StepTrace]:
+    # Pivots are searched in the first n_cols columns only
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "auto":
+        backend = _choose_backend(matrix)
+    if backend == "numpy" and np is None:
+        raise ImportError("The numpy backend requires NumPy to be installed")
+
+    steps = StepTrace(trace)
+    n = len(matrix)
+    m = len(matrix[0]) - 1
+    
+    if steps.full:
+        steps.append("Starting Gauss-Jordan elimination:")
+        steps.record("system", n, m)
+        steps.append("Initial augmented matrix:")
+        steps.record("matrix", data=[row[:] for row in matrix])
+    
+    if backend == "numpy":
+        reduced, pivot_columns = _eliminate_numpy(matrix, steps, n_cols)
+    elif backend == "fraction":
+        reduced, pivot_columns = _eliminate_python(_to_fractions(matrix), steps, n_cols, tol=0)
+    elif backend == "bareiss":
+        reduced, pivot_columns = _eliminate_bareiss(matrix, steps, n_cols)
+    else:
+        reduced, pivot_columns = _eliminate_python([row[:] for row in matrix], steps, n_cols)
+    
+    return reduced, pivot_columns, steps
+
+
+def gauss_jordan_elimination(matrix: List[List[float]], backend: str = "auto", trace: str = "full", augmented: bool = True) -> Tuple[List[List[float]], StepTrace]:
+    """
+    Reduce a matrix to reduced row echelon form with partial pivoting.
+
+    Pivots advance along the columns: a column with no usable pivot is
+    skipped and the same row is tried on the next column, so singular and
+    rectangular input come out in true RREF. With augmented=True (the
+    default) the matrix is [A|b] and the last column is never a pivot
+    column.
+
+    backend: "python" (nested loops over lists), "numpy" (vectorized pivot
+    steps) or "auto" (NumPy for larger real-valued input when installed).
+    Both float backends return the same lists of lists and step messages.
+    The exact backends "fraction" (Fraction arithmetic) and "bareiss"
+    (fraction-free integer elimination) return Fraction entries and use
+    exact zero tests instead of the 1e-10 tolerance.
+
+    trace: "full" (row operations plus a matrix snapshot per pivot), "ops"
+    (row operations only) or "none". Steps come back as a StepTrace that
+    renders each record to text only when it is read.
+    """
+    n_cols = len(matrix[0]) - 1 if augmented else len(matrix[0])
+    reduced, _, steps = _gauss_jordan(matrix, backend, trace, n_cols)
+    return reduced, steps
+
+
+class RREF(NamedTuple):
+    matrix: List[List[float]]          # reduced row echelon form of A (or [A|b])
+    pivot_columns: List[int]
+    rank: int
+    nullspace: List[List[float]]       # basis of {x : A x = 0}, one vector per free column
+    particular: Optional[List[float]]  # a solution of A x = b with free variables 0; None if inconsistent or no b
+
+
+def rref(coefficients: List[List[float]], constants: Optional[List[float]] = None, backend: str = "auto") -> RREF:
+    """
+    Rank-revealing RREF of an m x n matrix A, optionally with a right-hand
+    side b. Every solution of A x = b is particular + any combination of the
+    nullspace vectors. The exact backends give exact rank and basis vectors.
+    """
+    n = len(coefficients[0]) if coefficients else 0
+    if constants is None:
+        matrix = [list(row) for row in coefficients]
+    else:
+        if len(coefficients) != len(constants):
+            raise ValueError("Number of equations must equal number of constants")
+        matrix = [list(row) + [b] for row, b in zip(coefficients, constants)]
+    
+    reduced, pivot_columns, _ = _gauss_jordan(matrix, backend, "none", n)
+    rank = len(pivot_columns)
+    tol = 0 if backend in EXACT_BACKENDS else 1e-10
+    zero, one = (Fraction(0), Fraction(1)) if backend in EXACT_BACKENDS else (0.0, 1.0)
+    
+    nullspace = []
+    for free in sorted(set(range(n)) - set(pivot_columns)):
+        v = [zero] * n
+        v[free] = one
+        for k, col in enumerate(pivot_columns):
+            v[col] = -reduced[k][free]
+        nullspace.append(v)
+    
+    particular = None
+    if constants is not None and all(_is_zero(reduced[i][-1], tol) for i in range(rank, len(reduced))):
+        particular = [zero] * n
+        for k, col in enumerate(pivot_columns):
+            particular[col] = reduced[k][-1]
+    
+    return RREF(reduced, pivot_columns, rank, nullspace, particular)
+
+
+def _is_zero(x, tol: float) -> bool:
+    return x == 0 if tol == 0 else abs(x) < tol
+
+
+def _solve_sparse(coefficients, constants: List[float], trace: str) -> Tuple[Optional[List[float]], Sequence[str]]:
+    # Markowitz-ordered sparse elimination; the trace gets the fill-in
+    # statistics instead of per-row operations
+    steps = StepTrace(trace)
+    # Dict rows carry no width; a system has one column per equation
+    width = len(coefficients) if isinstance(coefficients, (list, tuple)) else None
+    lu = sparse_factorize(coefficients, n_cols=width)
+    m, n = lu.shape
+    if m != len(constants):
+        return None, ["Error: Number of equations must equal number of constants"]
+    if m != n:
+        return None, ["Error: Coefficient matrix must be square (same number of equations and variables)"]
+    
+    if steps.full:
+        steps.record("system", m, n)
+    steps.record("fill", data=lu.stats)
+    
+    if not lu.is_consistent(constants):
+        steps.record("inconsistent")
+        return None, steps
+    if lu.rank < n:
+        steps.record("infinite", lu.rank, n)
+        return None, steps
+    
+    solution = lu.solve(constants)
+    steps.record("solution", data=solution)
+    return solution, steps
+
+
+def _solve_out_of_core(coefficients, constants: List[float], trace: str,
+                       memory_budget: Optional[int]) -> Tuple[Optional[List[float]], Sequence[str]]:
+    # Blocked LU streamed from disk; the trace gets the I/O statistics
+    steps = StepTrace(trace)
+    options = {} if memory_budget is None else {"memory_budget": memory_budget}
+    lu = factorize_out_of_core(coefficients, **options)
+    try:
+        n = len(lu.perm)
+        if n != len(constants):
+            return None, ["Error: Number of equations must equal number of constants"]
+        if steps.full:
+            steps.record("system", n, n)
+        
+        solution = lu.solve(constants)
+        steps.record("io", data=lu.stats)
+        if solution is None:
+            steps.record("singular")
+            return None, steps
+        solution = solution.tolist()
+        steps.record("solution", data=solution)
+        return solution, steps
+    finally:
+        os.remove(lu.path)
+
+
+def _solve_iterative(coefficients, constants: List[float], method: str, trace: str, tol: Optional[float],
+                     maxiter: Optional[int], x0: Optional[Sequence[float]]) -> Optional[Tuple[Optional[List[float]], Sequence[str]]]:
+    # None hands the system to elimination: "auto" chose a direct solve, or
+    # the iteration it chose did not converge
+    if np is None:
+        raise ImportError("Iterative methods require NumPy to be installed")
+    A = as_operator(coefficients)
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or A.shape[0] != len(constants):
+        return None, ["Error: Iterative methods need a square system with one constant per equation"]
+    
+    auto = method == "auto"
+    if auto:
+        method = choose_method(A)
+        if method == "direct":
+            return None
+    
+    options = {} if tol is None else {"tol": tol}
+    result = solve_iterative(A, constants, method, x0=x0, maxiter=maxiter, **options)
+    if auto and not result.converged:
+        return None
+    
+    steps = StepTrace(trace)
+    if steps.full:
+        steps.record("system", A.shape[0], A.shape[1])
+    steps.record("iterative", data=result)
+    if not result.converged:
+        return None, steps
+    solution = result.x.tolist()
+    steps.record("solution", data=solution)
+    return solution, steps
+
+
+def _solve_mixed(coefficients, constants: List[float], trace: str) -> Tuple[Optional[List[float]], Sequence[str]]:
+    # float32 elimination refined to double precision; the trace gets the
+    # refinement report with the achieved backward error
+    if np is None:
+        raise ImportError("Mixed precision requires NumPy to be installed")
+    steps = StepTrace(trace)
+    result = solve_mixed(coefficients, constants)
+    if steps.full:
+        steps.record("system", len(constants), len(constants))
+    if result is None:
+        steps.record("singular")
+        return None, steps
+    steps.record("mixed", data=result)
+    solution = result.x.tolist()
+    steps.record("solution", data=solution)
+    return solution, steps
+
+
+def solve_linear_system(coefficients: List[List[float]], constants: List[float], backend: str = "auto", trace: str = "full",
+                        method: str = "direct", tol: Optional[float] = None, maxiter: Optional[int] = None,
+                        x0: Optional[Sequence[float]] = None, precision: str = "double",
+                        memory_budget: Optional[int] = None) -> Tuple[Optional[List[float]], Sequence[str]]:
+    """
+    Solve A x = b by Gauss-Jordan elimination. A may be m x n; the unique
+    solution is returned when rank A = n and b is consistent, otherwise
+    None (use rref() for the general solution).
+
+    Sparse coefficients (a SciPy sparse matrix or a list of {column: value}
+    rows) go to the sparse Markowitz engine in sparse_elimination, and a
+    numpy.memmap or .npy path to the out-of-core solver in out_of_core,
+    which keeps its panels within memory_budget bytes (1 GiB by default);
+    backend applies to in-memory dense input only.
+
+    method: "direct" (elimination, the default), one of the iterative
+    methods "jacobi", "gauss_seidel", "sor", "cg", "gmres" (see iterative;
+    tol, maxiter and the warm start x0 apply to these), or "auto" to pick
+    from size, sparsity and symmetry, falling back to elimination when the
+    chosen iteration does not converge.
+
+    precision: "double", or "mixed" for dense square systems: float32
+    elimination with float64 iterative refinement (see mixed_precision),
+    falling back to float64 when A is too ill-conditioned or refinement
+    stalls. The trace reports the achieved backward error.
+    """
     try:
+        if method not in SOLVE_METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision}")
+        if method != "direct" and not isinstance(coefficients, (str, os.PathLike)):
+            solved = _solve_iterative(coefficients, constants, method, trace, tol, maxiter, x0)
+            if solved is not None:
+                return solved
+        
+        if precision == "mixed" and not is_sparse(coefficients) and not is_out_of_core(coefficients):
+            return _solve_mixed(coefficients, constants, trace)
+        
+        if is_sparse(coefficients):
+            return _solve_sparse(coefficients, constants, trace)
+        if is_out_of_core(coefficients):
+            return _solve_out_of_core(coefficients, constants, trace, memory_budget)
+        
         n = len(coefficients)
         if n != len(constants):
             return None, ["Error: Number of equations must equal number of constants"]
         
-        if n == 0 or len(coefficients[0]) != n:
-            return None, ["Error: Coefficient matrix must be square (same number of equations and variables)"]
+        if n == 0 or not coefficients[0]:
+            return None, ["Error: Coefficient matrix must not be empty"]
+        n_vars = len(coefficients[0])
         
         # Create augmented matrix [A|b]
         augmented_matrix = []
@@ -79,36 +590,33 @@ def solve_linear_system(coefficients: List[List[float]], constants: List[float])
             row = coefficients[i][:] + [constants[i]]
             augmented_matrix.append(row)
         
-        result_matrix, steps = gauss_jordan_elimination(augmented_matrix)
+        result_matrix, pivot_columns, steps = _gauss_jordan(augmented_matrix, backend, trace, n_vars)
+        rank = len(pivot_columns)
         
-        # Extract solution from last column
-        solution = [row[-1] for row in result_matrix]
+        # Exact backends decide zero exactly, float backends within 1e-10
+        zero_tol = 0 if backend in EXACT_BACKENDS else 1e-10
         
-        # Check for inconsistent system (0 = non-zero)
-        for i in range(n):
-            all_zero = all(abs(result_matrix[i][j]) < 1e-10 for j in range(n))
-            if all_zero and abs(result_matrix[i][-1]) > 1e-10:
-                steps.append("System is inconsistent - no solution exists")
+        # Check for inconsistent system: rows past the rank read 0 = b_i
+        for i in range(rank, n):
+            if not _is_zero(result_matrix[i][-1], zero_tol):
+                steps.record("inconsistent")
                 return None, steps
         
         # Check rank for infinite solutions
-        rank = 0
-        for i in range(n):
-            if not all(abs(result_matrix[i][j]) < 1e-10 for j in range(n)):
-                rank += 1
-        
-        if rank < n:
-            steps.append(f"System has infinite solutions (rank = {rank} < {n})")
+        if rank < n_vars:
+            steps.record("infinite", rank, n_vars)
             return None, steps
         
-        steps.append(f"Solution found: {[f'{x:.6f}' for x in solution]}")
+        # Extract solution from last column
+        solution = [row[-1] for row in result_matrix[:rank]]
+        steps.record("solution", data=solution)
         return solution, steps
         
     except Exception as e:
         return None, [f"Error: {str(e)}"]
 
 
-def print_solution(solution: Optional[List[float]], steps: List[str], variable_names: Optional[List[str]] = None):
+def print_solution(solution: Optional[List[float]], steps: Sequence[str], variable_names: Optional[List[str]] = None):
     print("=" * 60)
     print("GAUSS-JORDAN ELIMINATION SOLVER")
     print("=" * 60)
@@ -124,7 +632,7 @@ def print_solution(solution: Optional[List[float]], steps: List[str], variable_n
             variable_names = [f"x{i+1}" for i in range(len(solution))]
         
         for i, (var, val) in enumerate(zip(variable_names, solution)):
-            print(f"{var} = {val:.6f}")
+            print(f"{var} = {float(val):.6f}")
     else:
         print("NO UNIQUE SOLUTION FOUND")
     
@@ -186,6 +694,37 @@ def example_3():
     print_solution(solution, steps)
 
 
+def benchmark_exact_modes(n: int = 50, trials: int = 3, seed: int = 0):
+    """Compare the float and exact backends on random n x n integer systems."""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    backends = ["python", "fraction", "bareiss"] + (["numpy"] if np is not None else [])
+    totals = {backend: 0.0 for backend in backends}
+    max_error = 0.0
+
+    for _ in range(trials):
+        coefficients = [[rng.randint(-99, 99) for _ in range(n)] for _ in range(n)]
+        constants = [rng.randint(-99, 99) for _ in range(n)]
+        solutions = {}
+        for backend in backends:
+            start = time.perf_counter()
+            solutions[backend], _ = solve_linear_system(coefficients, constants, backend=backend, trace="none")
+            totals[backend] += time.perf_counter() - start
+
+        exact = solutions["bareiss"]
+        assert exact == solutions["fraction"]
+        for backend in ("python", "numpy"):
+            if backend in solutions and solutions[backend] is not None:
+                max_error = max(max_error, max(abs(x - float(e)) for x, e in zip(solutions[backend], exact)))
+
+    print(f"{n}x{n} integer systems, {trials} trials")
+    for backend in backends:
+        print(f"{backend:>9}: {totals[backend] / trials:.4f} s per system")
+    print(f"max |float - exact| = {max_error:.3e}")
+
+
 if __name__ == "__main__":
     # Run examples
     example_1()
@@ -0,0 +1,300 @@
+"""
+Iterative solvers for large diagonally dominant, SPD and sparse systems.
+
+All methods only need products A @ x (plus a triangular solve for
+Gauss-Seidel/SOR), so they work unchanged on dense NumPy arrays and SciPy
+sparse matrices. Each returns an IterativeResult with the relative residual
+||b - A x|| / ||b|| recorded after every iteration.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import scipy.sparse as _sp
+    from scipy.linalg import solve_triangular as _solve_triangular
+    from scipy.sparse.linalg import spsolve_triangular as _spsolve_triangular
+except ImportError:  # SciPy is optional; dense input works without it
+    _sp = None
+    _solve_triangular = None
+    _spsolve_triangular = None
+
+METHODS = ("jacobi", "gauss_seidel", "sor", "cg", "gmres")
+
+DEFAULT_TOL = 1e-10
+DEFAULT_RESTART = 50
+# Below this size elimination is cheaper than any iteration setup
+ITERATIVE_MIN_SIZE = 200
+# Dense input with at most this fraction of nonzeros counts as sparse
+SPARSE_DENSITY = 0.05
+# Stationary iterations stop once the residual has grown by this factor
+DIVERGENCE_FACTOR = 1e6
+
+
+@dataclass
+class IterativeResult:
+    x: np.ndarray
+    converged: bool
+    iterations: int
+    method: str
+    residuals: List[float] = field(default_factory=list)  # relative residual, x0 first
+
+    def __str__(self) -> str:
+        residual = self.residuals[-1] if self.residuals else float("nan")
+        if self.converged:
+            return f"{self.method}: converged in {self.iterations} iterations (relative residual {residual:.3e})"
+        return f"{self.method}: no convergence after {self.iterations} iterations (relative residual {residual:.3e})"
+
+
+# ======== Input Helpers ========
+
+def as_operator(A):
+    """CSR for SciPy sparse input, a float ndarray otherwise."""
+    if _sp is not None and _sp.issparse(A):
+        return _sp.csr_matrix(A, dtype=float)
+    if isinstance(A, (list, tuple)) and A and all(isinstance(row, dict) for row in A):
+        # {column: value} rows, as accepted by sparse_elimination
+        n = len(A)
+        if _sp is not None:
+            rows = [i for i, row in enumerate(A) for _ in row]
+            cols = [j for row in A for j in row]
+            vals = [float(v) for row in A for v in row.values()]
+            return _sp.csr_matrix((vals, (rows, cols)), shape=(n, n))
+        dense = np.zeros((n, n))
+        for i, row in enumerate(A):
+            for j, v in row.items():
+                dense[i, j] = v
+        return dense
+    return np.asarray(A, dtype=float)
+
+
+def _is_sparse(A) -> bool:
+    return _sp is not None and _sp.issparse(A)
+
+
+def _diagonal(A) -> np.ndarray:
+    return np.asarray(A.diagonal(), dtype=float)
+
+
+def _start(A, b, x0):
+    b = np.asarray(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    bnorm = np.linalg.norm(b) or 1.0
+    return b, x, bnorm
+
+
+def _default_maxiter(n: int, maxiter: Optional[int]) -> int:
+    return 10 * n if maxiter is None else maxiter
+
+
+# ======== Stationary Methods ========
+
+def _stationary(A, b, x0, tol, maxiter, method, correction: Callable[[np.ndarray], np.ndarray]) -> IterativeResult:
+    # x <- x + M^-1 (b - A x) for the splitting matrix M of the method
+    b, x, bnorm = _start(A, b, x0)
+    r = b - A @ x
+    residuals = [np.linalg.norm(r) / bnorm]
+    maxiter = _default_maxiter(len(b), maxiter)
+    k = 0
+    with np.errstate(over="ignore", invalid="ignore"):
+        while residuals[-1] > tol and k < maxiter:
+            x += correction(r)
+            r = b - A @ x
+            residuals.append(np.linalg.norm(r) / bnorm)
+            k += 1
+            if not residuals[-1] <= DIVERGENCE_FACTOR * residuals[0]:
+                # Diverged (or overflowed); the splitting does not converge for this A
+                break
+    return IterativeResult(x, residuals[-1] <= tol, k, method, residuals)
+
+
+def jacobi(A, b, x0=None, tol: float = DEFAULT_TOL, maxiter: Optional[int] = None) -> IterativeResult:
+    """Jacobi iteration, M = D. Converges for strictly diagonally dominant A."""
+    A = as_operator(A)
+    d = _diagonal(A)
+    if np.any(d == 0):
+        raise ValueError("Jacobi iteration needs a nonzero diagonal")
+    return _stationary(A, b, x0, tol, maxiter, "jacobi", lambda r: r / d)
+
+
+def _lower_solver(A, omega: float) -> Callable[[np.ndarray], np.ndarray]:
+    # Solver for M = D / omega + L, the lower triangle of A with scaled diagonal
+    d = _diagonal(A)
+    if np.any(d == 0):
+        raise ValueError("Gauss-Seidel/SOR needs a nonzero diagonal")
+    if _is_sparse(A):
+        M = (_sp.tril(A, k=-1) + _sp.diags(d / omega)).tocsr()
+        return lambda r: _spsolve_triangular(M, r, lower=True)
+
+    M = np.tril(A, -1) + np.diag(d / omega)
+    if _solve_triangular is not None:
+        return lambda r: _solve_triangular(M, r, lower=True, check_finite=False)
+
+    def forward(r):
+        y = np.array(r, dtype=float)
+        for i in range(len(y)):
+            y[i] = (y[i] - M[i, :i] @ y[:i]) / M[i, i]
+        return y
+    return forward
+
+
+def gauss_seidel(A, b, x0=None, tol: float = DEFAULT_TOL, maxiter: Optional[int] = None) -> IterativeResult:
+    """Gauss-Seidel, M = D + L. Converges for diagonally dominant or SPD A."""
+    A = as_operator(A)
+    return _stationary(A, b, x0, tol, maxiter, "gauss_seidel", _lower_solver(A, 1.0))
+
+
+def sor(A, b, omega: float = 1.5, x0=None, tol: float = DEFAULT_TOL, maxiter: Optional[int] = None) -> IterativeResult:
+    """Successive over-relaxation, M = D / omega + L with 0 < omega < 2."""
+    if not 0 < omega < 2:
+        raise ValueError("SOR needs 0 < omega < 2")
+    A = as_operator(A)
+    return _stationary(A, b, x0, tol, maxiter, "sor", _lower_solver(A, omega))
+
+
+# ======== Krylov Methods ========
+
+def conjugate_gradient(A, b, x0=None, tol: float = DEFAULT_TOL, maxiter: Optional[int] = None) -> IterativeResult:
+    """Conjugate Gradient for symmetric positive definite A."""
+    A = as_operator(A)
+    b, x, bnorm = _start(A, b, x0)
+    r = b - A @ x
+    p = r.copy()
+    rr = r @ r
+    residuals = [np.sqrt(rr) / bnorm]
+    maxiter = _default_maxiter(len(b), maxiter)
+    k = 0
+    while residuals[-1] > tol and k < maxiter:
+        Ap = A @ p
+        pAp = p @ Ap
+        if pAp <= 0:
+            # A is not positive definite along p
+            break
+        alpha = rr / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        rr_new = r @ r
+        p = r + (rr_new / rr) * p
+        rr = rr_new
+        residuals.append(np.sqrt(rr) / bnorm)
+        k += 1
+    return IterativeResult(x, residuals[-1] <= tol, k, "cg", residuals)
+
+
+def gmres(A, b, x0=None, tol: float = DEFAULT_TOL, maxiter: Optional[int] = None, restart: int = DEFAULT_RESTART) -> IterativeResult:
+    """
+    Restarted GMRES(restart) for general nonsingular A. The residuals are
+    the Arnoldi estimates; the true residual is recomputed at each restart.
+    """
+    A = as_operator(A)
+    b, x, bnorm = _start(A, b, x0)
+    n = len(b)
+    restart = min(restart, n)
+    maxiter = _default_maxiter(n, maxiter)
+    residuals = []
+    k = 0
+
+    while True:
+        r = b - A @ x
+        beta = np.linalg.norm(r)
+        residuals.append(beta / bnorm)
+        if residuals[-1] <= tol or k >= maxiter:
+            break
+
+        V = np.zeros((restart + 1, n))
+        H = np.zeros((restart + 1, restart))
+        cs = np.zeros(restart)
+        sn = np.zeros(restart)
+        g = np.zeros(restart + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        for j in range(restart):
+            # Arnoldi step, classical Gram-Schmidt applied twice
+            w = A @ V[j]
+            h = V[:j + 1] @ w
+            w -= h @ V[:j + 1]
+            h2 = V[:j + 1] @ w
+            w -= h2 @ V[:j + 1]
+            H[:j + 1, j] = h + h2
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Givens rotations keep H upper triangular
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            denom = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = (1.0, 0.0) if denom == 0 else (H[j, j] / denom, H[j + 1, j] / denom)
+            H[j, j] = denom
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] *= cs[j]
+
+            k += 1
+            estimate = abs(g[j + 1]) / bnorm
+            if estimate <= tol or k >= maxiter or H[j, j] == 0:
+                break
+            residuals.append(estimate)
+
+        m = j + 1
+        y = np.zeros(m)
+        for i in range(m - 1, -1, -1):
+            if H[i, i] != 0:
+                y[i] = (g[i] - H[i, i + 1:m] @ y[i + 1:]) / H[i, i]
+        x += V[:m].T @ y
+
+    return IterativeResult(x, residuals[-1] <= tol, k, "gmres", residuals)
+
+
+# ======== Dispatch ========
+
+def solve_iterative(A, b, method: str = "cg", x0: Optional[Sequence[float]] = None, tol: float = DEFAULT_TOL,
+                    maxiter: Optional[int] = None, **options) -> IterativeResult:
+    """Run one of METHODS; options are omega (sor) and restart (gmres)."""
+    if method == "jacobi":
+        return jacobi(A, b, x0, tol, maxiter)
+    if method == "gauss_seidel":
+        return gauss_seidel(A, b, x0, tol, maxiter)
+    if method == "sor":
+        return sor(A, b, options.get("omega", 1.5), x0, tol, maxiter)
+    if method == "cg":
+        return conjugate_gradient(A, b, x0, tol, maxiter)
+    if method == "gmres":
+        return gmres(A, b, x0, tol, maxiter, options.get("restart", DEFAULT_RESTART))
+    raise ValueError(f"Unknown iterative method: {method}")
+
+
+def choose_method(A) -> str:
+    """
+    "direct" for small or dense general systems, otherwise the cheapest
+    iterative method the structure allows: CG for symmetric matrices with
+    a positive diagonal, Gauss-Seidel for strictly diagonally dominant
+    ones, GMRES for other sparse ones.
+    """
+    n = A.shape[0]
+    if n < ITERATIVE_MIN_SIZE:
+        return "direct"
+
+    if _is_sparse(A):
+        sparse = True
+        scale = abs(A).max() if A.nnz else 1.0
+        symmetric = A.nnz == 0 or abs(A - A.T).max() <= 1e-12 * scale
+        off_diagonal = np.asarray(abs(A).sum(axis=1)).ravel()
+    else:
+        sparse = np.count_nonzero(A) <= SPARSE_DENSITY * A.size
+        scale = np.abs(A).max(initial=0.0) or 1.0
+        symmetric = np.allclose(A, A.T, rtol=0, atol=1e-12 * scale)
+        off_diagonal = np.abs(A).sum(axis=1)
+
+    d = np.abs(_diagonal(A))
+    off_diagonal = off_diagonal - d
+    if symmetric and np.all(_diagonal(A) > 0):
+        return "cg"
+    if np.all(d > off_diagonal):
+        return "gauss_seidel"
+    if sparse:
+        return "gmres"
+    return "direct"
@@ -0,0 +1,99 @@
+"""
+Mixed-precision solve: float32 elimination, float64 iterative refinement.
+
+The O(n^3) elimination runs on a float32 copy of A (half the memory and
+bandwidth of float64). The solution is then refined in double precision,
+x <- x + A32^-1 (b - A x), with the residual formed in float64 and every
+correction costing only O(n^2) triangular solves with the float32 factors.
+When A is too ill-conditioned for single precision (estimated from the
+factors) or refinement stops making progress, the solve falls back to a
+float64 factorization.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from factorization import factorize
+
+# Refinement steps before giving up (LAPACK xSGESV uses 30)
+MAX_REFINEMENT_STEPS = 30
+# A step must cut the backward error at least by this factor
+STALL_RATIO = 0.5
+# Single precision is hopeless once cond(A) * eps32 exceeds this
+MAX_CONDITION_EPS = 0.1
+
+_EPS32 = float(np.finfo(np.float32).eps)
+_EPS64 = float(np.finfo(np.float64).eps)
+
+
+@dataclass
+class MixedResult:
+    x: np.ndarray
+    backward_error: float  # ||b - A x||_inf / (||A||_inf ||x||_inf + ||b||_inf)
+    condition: float       # 1-norm condition estimate from the factors
+    iterations: int        # refinement steps taken
+    precision: str         # "mixed", or "double" after a fallback
+    backward_errors: List[float] = field(default_factory=list)  # one per refinement step
+
+    def __str__(self) -> str:
+        how = (
+            f"float32 elimination + {self.iterations} refinement steps"
+            if self.precision == "mixed" else "float64 elimination (fallback)"
+        )
+        return f"Mixed precision: {how}, backward error {self.backward_error:.2e}, condition estimate {self.condition:.2e}"
+
+
+def backward_error(A: np.ndarray, x: np.ndarray, b: np.ndarray) -> float:
+    """Normwise backward error ||b - A x||_inf / (||A||_inf ||x||_inf + ||b||_inf)."""
+    r = b - A @ x
+    denom = np.abs(A).sum(axis=1).max(initial=0.0) * np.abs(x).max(initial=0.0) + np.abs(b).max(initial=0.0)
+    return float(np.abs(r).max(initial=0.0) / denom) if denom else 0.0
+
+
+def _solve_double(A, b, condition, history) -> Optional[MixedResult]:
+    f64 = factorize(A)
+    if f64.is_singular:
+        return None
+    x = f64.solve(b)
+    if not np.isfinite(condition):
+        condition = f64.condition_estimate()
+    return MixedResult(x, backward_error(A, x, b), condition, len(history), "double", history)
+
+
+def solve_mixed(coefficients, constants: Sequence[float], tol: Optional[float] = None,
+                max_steps: int = MAX_REFINEMENT_STEPS) -> Optional[MixedResult]:
+    """
+    Solve the square system A x = b to double precision accuracy with a
+    float32 factorization. tol is the target backward error, by default
+    sqrt(n) * eps64 (the LAPACK xSGESV criterion). None if A is singular.
+    """
+    A = np.asarray(coefficients, dtype=np.float64)
+    b = np.asarray(constants, dtype=np.float64)
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or A.shape[0] != b.shape[0]:
+        raise ValueError("Mixed precision needs a square system with one constant per equation")
+    n = A.shape[0]
+    if tol is None:
+        tol = np.sqrt(n) * _EPS64
+
+    f32 = factorize(A, dtype=np.float32)
+    condition = f32.condition_estimate()
+    if f32.is_singular or condition * _EPS32 > MAX_CONDITION_EPS:
+        return _solve_double(A, b, condition, [])
+
+    x = f32.solve(b.astype(np.float32)).astype(np.float64)
+    history = []
+    for step in range(max_steps + 1):
+        r = b - A @ x
+        berr = backward_error(A, x, b)
+        history.append(berr)
+        if berr <= tol:
+            return MixedResult(x, berr, condition, step, "mixed", history)
+        if step == max_steps or (step and berr > STALL_RATIO * history[-2]) or not np.isfinite(berr):
+            break
+        # Scale the residual so it neither underflows nor overflows in float32
+        scale = np.abs(r).max()
+        x += f32.solve((r / scale).astype(np.float32)).astype(np.float64) * scale
+
+    return _solve_double(A, b, condition, history)
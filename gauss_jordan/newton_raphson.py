@@ -1,47 +1,482 @@
+"""
+Newton and quasi-Newton methods for unconstrained minimization in n dimensions.
+
+newton_minimize(f, x0) repeatedly solves H(x) delta = -grad f(x) with a
+factorization of the Hessian (factorization.factorize) and stops on a small
+gradient or a small step. method="bfgs" and method="lbfgs" replace the
+Hessian by an approximation updated from gradient differences, so each
+iteration only needs a gradient. Steps are globalized by a line search:
+Armijo backtracking for Newton, whose Hessian is shifted to be positive
+definite when it is not (modified Cholesky), and a strong Wolfe search for
+the quasi-Newton modes, which guarantees the curvature their updates need.
+
+Derivatives are central finite differences, taken from one batch of stencil
+points per iteration (finite_differences); with vectorized=True the
+objective maps a (k, n) array of points to k values and is called once per
+iteration. A SymPy expression as objective gets exact, compiled derivatives
+instead (symbolic). Every iteration is recorded with its function value,
+gradient norm, step size, function evaluations and wall-clock time.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from factorization import factorize
+from finite_differences import Derivatives, derivatives
+from symbolic import compile_objective, is_expression
+
+METHODS = ("newton", "bfgs", "lbfgs")
+
+CONVERGED_GRADIENT = "gradient norm below gtol"
+CONVERGED_STEP = "step size below xtol"
+SINGULAR_HESSIAN = "singular Hessian"
+NONFINITE_HESSIAN = "Hessian is not finite"
+LINE_SEARCH_FAILED = "line search found no decrease"
+MAX_ITERATIONS = "maximum number of iterations reached"
+
+# Armijo condition f(x + a p) <= f(x) + ARMIJO_C1 * a * grad.p
+ARMIJO_C1 = 1e-4
+# Backtracking shrinks the step length by this factor, at most MAX_BACKTRACKS times
+BACKTRACK_FACTOR = 0.5
+MAX_BACKTRACKS = 40
+# Strong Wolfe curvature condition |grad(x + a p).p| <= WOLFE_C2 * |grad.p|
+WOLFE_C2 = 0.9
+# Trial steps of the Wolfe search: bracketing (doubling) and zooming
+MAX_BRACKET_STEPS = 20
+MAX_ZOOM_STEPS = 30
+# Smallest shift tried by the modified Cholesky, relative to max |H_ii|, and
+# the number of doublings tried before giving up
+MIN_HESSIAN_SHIFT = 1e-3
+MAX_HESSIAN_SHIFTS = 60
+# Correction pairs kept by L-BFGS
+LBFGS_MEMORY = 10
+
+
+@dataclass
+class NewtonIteration:
+    iteration: int
+    fun: float           # f at the start of the iteration
+    grad_norm: float     # ||grad f||_inf at the start of the iteration
+    step_norm: float     # ||delta||_2 of the step taken (0 if none)
+    step_length: float   # line search multiple of the direction (1 for a full step)
+    hessian: bool        # whether the Hessian was evaluated in this iteration
+    f_evals: int         # points at which f was evaluated in this iteration
+    f_calls: int         # calls to f in this iteration (1 when vectorized)
+    seconds: float       # wall-clock time of this iteration
+
+
+@dataclass
+class NewtonResult:
+    x: np.ndarray
+    fun: float
+    converged: bool
+    message: str
+    iterations: int
+    f_evals: int
+    f_calls: int
+    method: str
+    history: List[NewtonIteration] = field(default_factory=list)
+
+
+class _Counted:
+    # Wraps the objective and counts calls and evaluated points
+    def __init__(self, f: Callable, vectorized: bool = False):
+        self.f = f
+        self.vectorized = vectorized
+        self.calls = 0
+        self.points = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if self.vectorized:
+            self.points += len(x)
+            return self.f(x)
+        self.points += 1
+        return float(self.f(x))
+
+    def value(self, x: np.ndarray) -> float:
+        if self.vectorized:
+            return float(np.asarray(self(x[None, :]), dtype=float).reshape(-1)[0])
+        return self(x)
+
+
+def _evaluator(f, vectorized: bool, symbols) -> Tuple[_Counted, Callable[[np.ndarray, bool], Derivatives]]:
+    # The counted objective and a function returning f, gradient and (optionally) Hessian at x
+    if is_expression(f):
+        compiled = compile_objective(f, symbols)
+        fun = _Counted(compiled.fun)
+
+        def exact(x, hessian):
+            fun.calls += 1
+            fun.points += 1
+            return compiled.derivatives(x, hessian)
+        return fun, exact
+
+    fun = _Counted(f, vectorized)
+    return fun, lambda x, hessian: derivatives(fun, x, hessian=hessian, vectorized=vectorized)
+
+
+# ======== Finite Differences ========
+
+def gradient(f: Callable[[np.ndarray], float], x: Sequence[float], h: Optional[float] = 1e-5,
+             vectorized: bool = False) -> np.ndarray:
+    """Central-difference gradient, 2n + 1 points; h=None picks steps per coordinate."""
+    return derivatives(f, x, hessian=False, vectorized=vectorized, h=h).grad
+
+
+def hessian(f: Callable[[np.ndarray], float], x: Sequence[float], h: Optional[float] = 1e-4,
+            vectorized: bool = False) -> np.ndarray:
+    """Central-difference Hessian, 2n^2 + 1 points; h=None picks steps per coordinate."""
+    return derivatives(f, x, hessian=True, vectorized=vectorized, h=h).hess
+
+
+# ======== Search Directions ========
+
+def newton_step(grad: np.ndarray, hess: np.ndarray) -> Optional[np.ndarray]:
+    """Solve hess * delta = -grad; None if the Hessian is singular."""
+    return factorize(hess).solve(-grad)
+
+
+def _positive_definite(hess: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Modified Cholesky: H + tau I for the smallest tau in a doubling sequence
+    that makes it positive definite (tau = 0 when H already is). None if H
+    is not finite or no shift in the sequence works.
+    """
+    if not np.isfinite(hess).all():
+        # cholesky accepts NaN, so a non-finite H would come back as NaN
+        return None
+    diagonal = np.diag(hess)
+    beta = MIN_HESSIAN_SHIFT * max(1.0, float(np.abs(diagonal).max(initial=0.0)))
+    tau = 0.0 if diagonal.min(initial=1.0) > 0 else beta - diagonal.min()
+    identity = np.eye(len(hess))
+    for _ in range(MAX_HESSIAN_SHIFTS):
+        with np.errstate(over="ignore"):
+            shifted = hess + tau * identity
+        if not np.isfinite(shifted).all():
+            return None
+        try:
+            np.linalg.cholesky(shifted)
+            return shifted
+        except np.linalg.LinAlgError:
+            tau = max(2 * tau, beta)
+    return None
+
+
+def _inverse_hessian(hess: np.ndarray) -> Optional[np.ndarray]:
+    # H^-1 for a BFGS restart; None unless H is finite and positive definite
+    if not np.isfinite(hess).all():
+        return None
+    try:
+        np.linalg.cholesky(hess)
+    except np.linalg.LinAlgError:
+        return None
+    return factorize(hess).solve_many(np.eye(len(hess)))
+
+
+def _bfgs_update(inverse: np.ndarray, s: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # BFGS update of the inverse Hessian approximation for the step s and gradient change y
+    rho = 1.0 / (y @ s)
+    Hy = inverse @ y
+    return inverse + rho * ((1 + rho * (y @ Hy)) * np.outer(s, s) - np.outer(Hy, s) - np.outer(s, Hy))
+
+
+def _lbfgs_direction(grad: np.ndarray, pairs) -> np.ndarray:
+    # Two-loop recursion: -H grad for the inverse Hessian implied by the (s, y, rho) pairs
+    q = grad.copy()
+    alphas = []
+    for s, y, rho in reversed(pairs):
+        a = rho * (s @ q)
+        q -= a * y
+        alphas.append(a)
+    if pairs:
+        s, y, _ = pairs[-1]
+        q *= (s @ y) / (y @ y)
+    for (s, y, rho), a in zip(pairs, reversed(alphas)):
+        q += (a - rho * (y @ q)) * s
+    return -q
+
+
+def backtrack(f: Callable[[np.ndarray], float], x: np.ndarray, fx: float, grad: np.ndarray,
+              direction: np.ndarray) -> Tuple[Optional[np.ndarray], float]:
+    """
+    Armijo backtracking line search from the full step. Returns (delta,
+    step length), or (None, 0.0) when no sufficient decrease was found.
+    """
+    slope = grad @ direction
+    alpha = 1.0
+    for _ in range(MAX_BACKTRACKS):
+        delta = alpha * direction
+        if f(x + delta) <= fx + ARMIJO_C1 * alpha * slope:
+            return delta, alpha
+        alpha *= BACKTRACK_FACTOR
+    return None, 0.0
+
+
+def _wolfe_search(f: Callable[[np.ndarray], float], evaluate: Callable[[np.ndarray, bool], Derivatives],
+                  x: np.ndarray, fx: float, grad: np.ndarray,
+                  direction: np.ndarray) -> Tuple[Optional[float], Optional[Derivatives]]:
+    """
+    Strong Wolfe line search (Nocedal & Wright, algorithms 3.5 and 3.6).
+    Returns the step length and the derivatives there, reused by the next
+    iteration, or (None, None) when no step lowers f. A trial point costs
+    one f evaluation; its gradient is only taken once f has decreased enough.
+    """
+    slope0 = grad @ direction
+    # Step lengths closer than this no longer change x in floating point
+    resolution = np.finfo(float).eps * max(1.0, float(np.abs(x).max(initial=0.0))) / float(np.abs(direction).max())
+
+    def value(alpha):
+        fa = f(x + alpha * direction)
+        return fa if np.isfinite(fa) else np.inf
+
+    def derivatives_at(alpha):
+        d = evaluate(x + alpha * direction, False)
+        return d, d.grad @ direction
+
+    def sufficient(alpha, fa):
+        return fa <= fx + ARMIJO_C1 * alpha * slope0
+
+    def zoom(lo, f_lo, s_lo, d_lo, hi, f_hi):
+        for _ in range(MAX_ZOOM_STEPS):
+            width = hi - lo
+            if abs(width) <= resolution:
+                break
+            # Minimizer of the quadratic through f_lo, s_lo and f_hi, kept inside the bracket
+            curvature = f_hi - f_lo - s_lo * width
+            alpha = lo - s_lo * width**2 / (2 * curvature) if np.isfinite(curvature) and curvature > 0 else lo + width / 2
+            if not min(lo, hi) + 0.1 * abs(width) <= alpha <= max(lo, hi) - 0.1 * abs(width):
+                alpha = lo + width / 2
+            fa = value(alpha)
+            if not sufficient(alpha, fa) or fa >= f_lo:
+                hi, f_hi = alpha, fa
+                continue
+            d, s = derivatives_at(alpha)
+            if abs(s) <= -WOLFE_C2 * slope0:
+                return alpha, d
+            if s * (hi - lo) >= 0:
+                hi, f_hi = lo, f_lo
+            lo, f_lo, s_lo, d_lo = alpha, d.fun, s, d
+        # No Wolfe point found: settle for the best point with sufficient decrease
+        return (lo, d_lo) if lo > 0 else (None, None)
+
+    previous, f_previous, s_previous, d_previous = 0.0, fx, slope0, None
+    alpha = 1.0
+    for i in range(MAX_BRACKET_STEPS):
+        fa = value(alpha)
+        if not sufficient(alpha, fa) or (i and fa >= f_previous):
+            return zoom(previous, f_previous, s_previous, d_previous, alpha, fa)
+        d, s = derivatives_at(alpha)
+        if abs(s) <= -WOLFE_C2 * slope0:
+            return alpha, d
+        if s >= 0:
+            return zoom(alpha, d.fun, s, d, previous, f_previous)
+        previous, f_previous, s_previous, d_previous = alpha, d.fun, s, d
+        alpha *= 2
+    return previous, d_previous
+
+
+# ======== Minimization ========
+
+def newton_minimize(
+    f: Callable[[np.ndarray], float],
+    x0: Sequence[float],
+    gtol: float = 1e-8,
+    xtol: float = 1e-10,
+    maxiter: int = 100,
+    callback: Optional[Callable[[np.ndarray, NewtonIteration], None]] = None,
+    vectorized: bool = False,
+    symbols: Optional[Sequence] = None,
+    method: str = "newton",
+    line_search: bool = True,
+    hessian_refresh: Optional[int] = None,
+    memory: int = LBFGS_MEMORY,
+) -> NewtonResult:
+    """
+    Minimize f: R^n -> R from x0 with one of METHODS.
+
+    Stops when ||grad f||_inf <= gtol, when the step satisfies
+    ||delta|| <= xtol * (1 + ||x||), when the line search fails (or, without
+    line search, the Hessian is singular), or after maxiter iterations.
+    callback(x, record) is called after every iteration. With
+    vectorized=True, f takes a (k, n) array and returns k values.
+
+    f may also be a SymPy expression in symbols (by default its free symbols
+    sorted by name; x[i] is symbols[i]). Its gradient and Hessian are then
+    derived exactly and compiled once, and f_evals counts evaluations of
+    f, gradient and Hessian together.
+
+    hessian_refresh is the number of iterations between Hessian evaluations:
+    "newton" reuses the factorization in between as long as its full steps
+    are accepted (default 1, every iteration); "bfgs" restarts its
+    approximation from the true Hessian (default None, start from a scaled
+    identity and never refresh). "lbfgs" keeps the last memory
+    gradient-difference pairs and never forms a Hessian.
+
+    With line_search, Newton shifts an indefinite or singular Hessian to
+    H + tau I (modified Cholesky) and backtracks; BFGS and L-BFGS use a
+    strong Wolfe search so every update sees positive curvature. Should an
+    update still be skipped, the approximation restarts from steepest
+    descent.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {METHODS}")
+    if method == "newton" and hessian_refresh is None:
+        hessian_refresh = 1
+    if method == "lbfgs" and hessian_refresh is not None:
+        raise ValueError("L-BFGS never evaluates the Hessian; hessian_refresh must be None")
+    if hessian_refresh is not None and hessian_refresh < 1:
+        raise ValueError("hessian_refresh must be a positive number of iterations")
+
+    fun, evaluate = _evaluator(f, vectorized, symbols)
+    x = np.array(x0, dtype=float)
+    history = []
+    converged = False
+    message = MAX_ITERATIONS
+    factor = None                 # newton: factorization of the last Hessian
+    inverse = None                # bfgs: inverse Hessian approximation
+    pairs = deque(maxlen=memory)  # lbfgs: (s, y, 1 / y.s) correction pairs
+    previous = None               # (x, grad) before the last step
+    refreshed = None              # iteration of the last Hessian evaluation
+    pending = None                # derivatives at x found by the Wolfe search
+    alpha = 1.0
+
+    for k in range(maxiter):
+        start = time.perf_counter()
+        points, calls = fun.points, fun.calls
+        refresh = hessian_refresh is not None and (
+            refreshed is None or k - refreshed >= hessian_refresh or (method == "newton" and alpha < 1)
+        )
+        if refresh:
+            refreshed = k
+        d = pending if pending is not None and not refresh else evaluate(x, refresh)
+        pending = None
+        fx, g = d.fun, d.grad
+        grad_norm = float(np.abs(g).max(initial=0.0))
+
+        if previous is not None and method != "newton":
+            s, y = x - previous[0], g - previous[1]
+            sy = s @ y
+            # Skip the update unless the curvature condition keeps H positive definite
+            if sy > np.finfo(float).eps * np.linalg.norm(s) * np.linalg.norm(y):
+                if method == "bfgs":
+                    if inverse is None:
+                        inverse = (sy / (y @ y)) * np.eye(len(x))
+                    inverse = _bfgs_update(inverse, s, y)
+                else:
+                    pairs.append((s, y, 1.0 / sy))
+            else:
+                # Stale curvature information would stall the iteration; restart
+                inverse = None
+                pairs.clear()
+        if refresh and method == "bfgs":
+            inverse = _inverse_hessian(d.hess)
+
+        alpha = 0.0
+        if grad_norm <= gtol:
+            converged, message = True, CONVERGED_GRADIENT
+            delta = None
+        else:
+            if method == "newton":
+                if refresh:
+                    hess = _positive_definite(d.hess) if line_search else d.hess
+                    finite = hess is not None and np.isfinite(hess).all()
+                    factor = factorize(hess) if finite else None
+                direction = None if factor is None else factor.solve(-g)
+            elif method == "bfgs":
+                direction = -g if inverse is None else -(inverse @ g)
+            else:
+                direction = _lbfgs_direction(g, pairs)
+
+            if method == "newton" and factor is None:
+                # NaN or inf in the Hessian: no model to take a step from
+                delta, message = None, NONFINITE_HESSIAN
+            elif line_search:
+                if direction is None or not g @ direction < 0:
+                    # No descent direction (e.g. a stale Newton factorization): steepest descent
+                    direction = -g
+                if method == "newton":
+                    delta, alpha = backtrack(fun.value, x, fx, g, direction)
+                else:
+                    alpha, pending = _wolfe_search(fun.value, evaluate, x, fx, g, direction)
+                    if alpha is None:
+                        # E.g. at the noise floor of the gradient: plain backtracking
+                        delta, alpha = backtrack(fun.value, x, fx, g, direction)
+                    else:
+                        delta = alpha * direction
+                if delta is None:
+                    message = LINE_SEARCH_FAILED
+            elif direction is None:
+                delta, message = None, SINGULAR_HESSIAN
+            else:
+                delta, alpha = direction, 1.0
+
+            if delta is not None:
+                previous = (x, g)
+                x = x + delta
+
+        step_norm = 0.0 if delta is None else float(np.linalg.norm(delta))
+        record = NewtonIteration(k + 1, fx, grad_norm, step_norm, alpha, refresh, fun.points - points,
+                                 fun.calls - calls, time.perf_counter() - start)
+        history.append(record)
+        if callback is not None:
+            callback(x, record)
+
+        if delta is None:
+            break
+        if step_norm <= xtol * (1 + np.linalg.norm(x)):
+            converged, message = True, CONVERGED_STEP
+            break
+
+    return NewtonResult(x, fun.value(x), converged, message, len(history), fun.points, fun.calls, method, history)
+
+
+# ======== 2D Example ========
+
 def f(x, y):
     # The function we want to minimize: f(x, y) = x^2 + y^2
     return x**2 + y**2
 
+
+def _f_vector(p):
+    return f(p[0], p[1])
+
+
 def get_gradient(x, y, h=1e-5):
-    # Manual partial derivatives
-    df_dx = (f(x + h, y) - f(x - h, y)) / (2 * h)
-    df_dy = (f(x, y + h) - f(x, y - h)) / (2 * h)
-    return [df_dx, df_dy]
+    return list(gradient(_f_vector, [x, y], h))
+
 
 def get_hessian(x, y, h=1e-4):
-    # Manual second-order partial derivatives
-    f_xx = (f(x + h, y) - 2 * f(x, y) + f(x - h, y)) / (h**2)
-    f_yy = (f(x, y + h) - 2 * f(x, y) + f(x, y - h)) / (h**2)
-    
-    # Mixed partial derivative (f_xy)
-    f_xy = (f(x+h, y+h) - f(x+h, y-h) - f(x-h, y+h) + f(x-h, y-h)) / (4 * h**2)
-    
-    return [[f_xx, f_xy], 
-            [f_xy, f_yy]]
+    return hessian(_f_vector, [x, y], h).tolist()
+
 
 def solve_newton_step(curr_x, curr_y):
-    grad = get_gradient(curr_x, curr_y)
-    hess = get_hessian(curr_x, curr_y)
-    
     # To find the "correct path" step (delta), we solve: Hessian * delta = -Gradient
-    # For a 2x2 matrix [[a, b], [c, d]], the inverse is (1/det) * [[d, -b], [-c, a]]
-    det = hess[0][0] * hess[1][1] - hess[0][1] * hess[1][0]
-    
-    if abs(det) < 1e-9: return 0, 0 # Avoid division by zero
-    
-    inv_hess = [[hess[1][1]/det, -hess[0][1]/det],
-                [-hess[1][0]/det, hess[0][0]/det]]
-    
-    # delta = -inv_hess * grad
-    step_x = -(inv_hess[0][0] * grad[0] + inv_hess[0][1] * grad[1])
-    step_y = -(inv_hess[1][0] * grad[0] + inv_hess[1][1] * grad[1])
-    
-    return step_x, step_y
-
-# Optimization loop
-x, y = 10.0, 10.0 # Starting point
-for i in range(5):
-    dx, dy = solve_newton_step(x, y)
-    x += dx
-    y += dy
-    print(f"Step {i+1}: x={x:.4f}, y={y:.4f}")
\ No newline at end of file
+    grad = np.array(get_gradient(curr_x, curr_y))
+    direction = newton_step(grad, np.array(get_hessian(curr_x, curr_y)))
+    if direction is None or not grad @ direction < 0:
+        # Singular or indefinite Hessian: steepest descent instead of a zero step
+        direction = -grad
+    p = np.array([curr_x, curr_y], dtype=float)
+    delta, _ = backtrack(_f_vector, p, _f_vector(p), grad, direction)
+    if delta is None:
+        return 0, 0
+    return delta[0], delta[1]
+
+
+def main():
+    # Optimization loop
+    x, y = 10.0, 10.0 # Starting point
+    for i in range(5):
+        dx, dy = solve_newton_step(x, y)
+        x += dx
+        y += dy
+        print(f"Step {i+1}: x={x:.4f}, y={y:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Out-of-core elimination for dense systems larger than RAM.
+
+The matrix lives on disk as a row-major .npy file (or any numpy.memmap) and
+is factored P A = L U in place in a working copy, one block column (panel)
+at a time, with partial pivoting:
+
+1. the tall panel A[k:, k:k+w] is read and factored in memory,
+2. its row swaps are applied to whole rows on disk,
+3. the block row U12 = L11^-1 A12 is formed and written back,
+4. the trailing matrix A22 -= L21 U12 is streamed through in row tiles.
+
+Only the panel, U12 and one row tile are resident at a time, which fixes
+the panel width from the memory budget. A right-hand side is then solved
+by one streamed forward and one streamed back substitution.
+"""
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import numpy as np
+
+DEFAULT_MEMORY_BUDGET = 1 << 30  # bytes
+# Panels up to this width are factored column by column
+PANEL_BASE_WIDTH = 32
+
+_ITEMSIZE = np.dtype(float).itemsize
+
+
+@dataclass
+class IOStats:
+    bytes_read: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+    panels: int = 0
+    panel_width: int = 0
+    phases: dict = field(default_factory=dict)  # seconds per phase name
+
+    @property
+    def throughput(self) -> float:
+        """Bytes moved (read + written) per second."""
+        return (self.bytes_read + self.bytes_written) / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Out-of-core elimination: {self.panels} panels of width {self.panel_width}, "
+            f"read {self.bytes_read / 2**20:.1f} MiB, wrote {self.bytes_written / 2**20:.1f} MiB "
+            f"in {self.seconds:.2f} s ({self.throughput / 2**20:.1f} MiB/s)"
+        )
+
+
+class _Timer:
+    # Accumulates wall-clock seconds of one phase into IOStats.phases
+    def __init__(self, stats: IOStats, phase: str):
+        self.stats = stats
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        phases = self.stats.phases
+        phases[self.phase] = phases.get(self.phase, 0.0) + time.perf_counter() - self.start
+
+
+# ======== Input ========
+
+def is_out_of_core(matrix) -> bool:
+    """True for a numpy.memmap or a path to an .npy file."""
+    if isinstance(matrix, np.memmap):
+        return True
+    return isinstance(matrix, (str, os.PathLike)) and os.fspath(matrix).endswith(".npy")
+
+
+def open_matrix(source) -> np.ndarray:
+    """Memory-map an .npy path read-only; memmaps are passed through."""
+    if isinstance(source, np.memmap):
+        return source
+    return np.load(os.fspath(source), mmap_mode="r")
+
+
+def panel_width(n: int, memory_budget: int) -> int:
+    """
+    Widest panel that fits: the panel (n x w), U12 (w x n), one row tile
+    (w x n) and the product L21 U12 for that tile (w x n) are resident
+    together. The update writes into preallocated buffers, so these four
+    are all the factorization holds.
+    """
+    w = memory_budget // (4 * n * _ITEMSIZE)
+    if w < 1:
+        raise ValueError(f"Memory budget of {memory_budget} bytes cannot hold one column panel of {n} rows")
+    return min(n, int(w))
+
+
+# ======== Factorization ========
+
+class OutOfCoreLU:
+    """
+    P A = L U stored in the .npy file at path: L strictly below the diagonal
+    (unit diagonal implied), U on and above it. perm is the row permutation.
+    """
+
+    def __init__(self, path: str, perm: np.ndarray, singular: bool, tile_rows: int, tol: float, stats: IOStats):
+        self.path = path
+        self.perm = perm
+        self.singular = singular
+        self.tile_rows = tile_rows
+        self.tol = tol
+        self.stats = stats
+
+    @property
+    def lu(self) -> np.ndarray:
+        return np.load(self.path, mmap_mode="r")
+
+    def solve(self, b: Sequence[float]) -> Optional[np.ndarray]:
+        """
+        x with A x = b, streaming the factors once forward and once
+        backward. None if A is singular.
+        """
+        if self.singular:
+            return None
+        lu = self.lu
+        n = lu.shape[0]
+        t = self.tile_rows
+        stats = self.stats
+        start = time.perf_counter()
+
+        # Forward: L y = P b, unit lower triangular
+        y = np.asarray(b, dtype=float)[self.perm].copy()
+        for r0 in range(0, n, t):
+            r1 = min(n, r0 + t)
+            tile = np.array(lu[r0:r1, :r1])
+            stats.bytes_read += tile.nbytes
+            y[r0:r1] -= tile[:, :r0] @ y[:r0]
+            for i in range(r0, r1):
+                y[i] -= tile[i - r0, r0:i] @ y[r0:i]
+
+        # Backward: U x = y
+        x = y
+        for r1 in range(n, 0, -t):
+            r0 = max(0, r1 - t)
+            tile = np.array(lu[r0:r1, r0:])
+            stats.bytes_read += tile.nbytes
+            x[r0:r1] -= tile[:, r1 - r0:] @ x[r1:]
+            for i in range(r1 - 1, r0 - 1, -1):
+                k = i - r0
+                x[i] = (x[i] - tile[k, k + 1:r1 - r0] @ x[i + 1:r1]) / tile[k, k]
+
+        stats.seconds += time.perf_counter() - start
+        return x
+
+
+def _solve_unit_lower(L: np.ndarray, B: np.ndarray) -> np.ndarray:
+    # B <- L^-1 B in place for unit lower triangular L, row by row
+    for i in range(1, L.shape[0]):
+        B[i] -= L[i, :i] @ B[:i]
+    return B
+
+
+def _factor_panel(panel: np.ndarray, tol: float):
+    """
+    In-place LU with partial pivoting of a tall panel (rows x w). Returns
+    local row swaps [(i, j), ...] in order and whether a pivot was below tol.
+
+    Recursive on the column halves, so most of the work is the matrix
+    product A22 -= L21 U12 rather than one rank-1 update per column.
+    """
+    rows, w = panel.shape
+    if w <= PANEL_BASE_WIDTH:
+        swaps = []
+        singular = False
+        for k in range(min(rows, w)):
+            p = k + int(np.argmax(np.abs(panel[k:, k])))
+            if p != k:
+                panel[[k, p]] = panel[[p, k]]
+                swaps.append((k, p))
+            if abs(panel[k, k]) <= tol:
+                # No usable pivot in this column; leave it and carry on
+                singular = True
+                continue
+            panel[k + 1:, k] /= panel[k, k]
+            panel[k + 1:, k + 1:] -= np.outer(panel[k + 1:, k], panel[k, k + 1:])
+        return swaps, singular
+
+    h = w // 2
+    swaps, singular = _factor_panel(panel[:, :h], tol)
+    for i, j in swaps:
+        panel[[i, j], h:] = panel[[j, i], h:]
+    _solve_unit_lower(panel[:h, :h], panel[:h, h:])
+    panel[h:, h:] -= panel[h:, :h] @ panel[:h, h:]
+
+    right_swaps, right_singular = _factor_panel(panel[h:, h:], tol)
+    for i, j in right_swaps:
+        panel[[h + i, h + j], :h] = panel[[h + j, h + i], :h]
+    swaps += [(h + i, h + j) for i, j in right_swaps]
+    return swaps, singular or right_singular
+
+
+def factorize_out_of_core(
+    source,
+    out: Optional[str] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    tol: Optional[float] = None,
+) -> OutOfCoreLU:
+    """
+    Factor the square matrix in source (an .npy path or numpy.memmap) with
+    panels sized to memory_budget bytes. The factors are written to the .npy
+    file out (a temporary file by default, removed again if factorization
+    fails); source is never modified.
+
+    tol is the pivot threshold, by default n * eps * max|A| (max taken while
+    copying).
+    """
+    A = open_matrix(source)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Coefficient matrix must be square")
+    n = A.shape[0]
+    w = panel_width(n, memory_budget)
+    stats = IOStats(panel_width=w)
+    start = time.perf_counter()
+
+    temporary = out is None
+    if temporary:
+        fd, out = tempfile.mkstemp(suffix=".npy")
+        os.close(fd)
+    try:
+        lu = np.lib.format.open_memmap(out, mode="w+", dtype=float, shape=(n, n))
+
+        # Working copy, streamed in row tiles
+        amax = 0.0
+        with _Timer(stats, "copy"):
+            for r0 in range(0, n, w):
+                tile = np.asarray(A[r0:r0 + w], dtype=float)
+                amax = max(amax, float(np.abs(tile).max(initial=0.0)))
+                lu[r0:r0 + w] = tile
+                stats.bytes_read += tile.nbytes
+                stats.bytes_written += tile.nbytes
+        if tol is None:
+            tol = n * np.finfo(float).eps * max(1.0, amax)
+
+        perm = np.arange(n)
+        singular = False
+        for k0 in range(0, n, w):
+            k1 = min(n, k0 + w)
+            stats.panels += 1
+
+            with _Timer(stats, "panel"):
+                panel = np.array(lu[k0:, k0:k1])
+                stats.bytes_read += panel.nbytes
+                swaps, panel_singular = _factor_panel(panel, tol)
+                singular |= panel_singular
+
+            with _Timer(stats, "swap"):
+                # Whole-row swaps outside the panel; the panel itself is rewritten
+                for i, j in swaps:
+                    gi, gj = k0 + i, k0 + j
+                    perm[[gi, gj]] = perm[[gj, gi]]
+                    if k0:
+                        lu[[gi, gj], :k0] = lu[[gj, gi], :k0]
+                    if k1 < n:
+                        lu[[gi, gj], k1:] = lu[[gj, gi], k1:]
+                    stats.bytes_read += 2 * (n - (k1 - k0)) * _ITEMSIZE
+                    stats.bytes_written += 2 * (n - (k1 - k0)) * _ITEMSIZE
+                lu[k0:, k0:k1] = panel
+                stats.bytes_written += panel.nbytes
+
+            if k1 == n:
+                break
+
+            with _Timer(stats, "update"):
+                # U12 = L11^-1 A12
+                U12 = _solve_unit_lower(panel[:k1 - k0], np.array(lu[k0:k1, k1:]))
+                lu[k0:k1, k1:] = U12
+                stats.bytes_read += U12.nbytes
+                stats.bytes_written += U12.nbytes
+
+                # A22 -= L21 U12, one row tile at a time, in reused buffers
+                L21 = panel[k1 - k0:]
+                tile_buffer = np.empty((w, n - k1))
+                product_buffer = np.empty((w, n - k1))
+                for r0 in range(k1, n, w):
+                    r1 = min(n, r0 + w)
+                    tile = tile_buffer[:r1 - r0]
+                    product = product_buffer[:r1 - r0]
+                    tile[...] = lu[r0:r1, k1:]
+                    np.matmul(L21[r0 - k1:r1 - k1], U12, out=product)
+                    tile -= product
+                    lu[r0:r1, k1:] = tile
+                    stats.bytes_read += tile.nbytes
+                    stats.bytes_written += tile.nbytes
+                # Release this step's buffers before the next panel is read
+                del tile_buffer, product_buffer, tile, product, L21, U12, panel
+
+        lu.flush()
+        del lu
+    except BaseException:
+        # A failed factorization must not leave an n x n working copy behind
+        if temporary:
+            os.remove(out)
+        raise
+    stats.seconds = time.perf_counter() - start
+    return OutOfCoreLU(out, perm, singular, w, tol, stats)
@@ -0,0 +1,253 @@
+"""
+Sparse elimination with Markowitz pivoting.
+
+Rows are kept as {column: value} dicts, with the set of rows touching each
+column alongside, so an n x n system with a few nonzeros per row costs
+memory proportional to its nonzeros (plus fill), not n^2.
+
+Each pivot is chosen to keep fill low: among the active columns with the
+fewest nonzeros, the entry a_rc with the smallest Markowitz cost
+(r_count - 1) * (c_count - 1) wins, provided it passes the stability
+threshold |a_rc| >= threshold * max|column c|. The elimination record
+(multipliers and pivot rows) is kept, so further right-hand sides cost one
+sparse forward and one back substitution.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import scipy.sparse as _sp
+except ImportError:  # SciPy is optional; dict rows work without it
+    _sp = None
+
+SparseRow = Dict[int, float]
+
+# Relative pivot threshold: 1 is partial pivoting, smaller trades
+# stability for less fill
+DEFAULT_THRESHOLD = 0.1
+# Number of lowest-count columns examined per pivot search
+DEFAULT_SEARCH_COLUMNS = 4
+
+
+@dataclass
+class FillStats:
+    nnz_a: int        # nonzeros of the input
+    nnz_l: int        # multipliers (strictly lower part)
+    nnz_u: int        # nonzeros of the pivot rows, pivots included
+    fill_in: int      # entries created by elimination that were zero in the input
+    pivots: int       # number of pivots taken (numerical rank)
+    max_row_nnz: int  # longest pivot row
+
+    @property
+    def fill_ratio(self) -> float:
+        return (self.nnz_l + self.nnz_u) / max(1, self.nnz_a)
+
+    def __str__(self) -> str:
+        return (
+            f"Sparse elimination: {self.pivots} pivots, nnz {self.nnz_a} -> "
+            f"{self.nnz_l + self.nnz_u} (fill-in {self.fill_in}, ratio {self.fill_ratio:.2f})"
+        )
+
+
+# ======== Input Conversion ========
+
+def is_sparse(matrix) -> bool:
+    """True for SciPy sparse matrices and for a list of dict rows."""
+    if _sp is not None and _sp.issparse(matrix):
+        return True
+    return isinstance(matrix, (list, tuple)) and len(matrix) > 0 and all(isinstance(row, dict) for row in matrix)
+
+
+def to_sparse_rows(matrix, n_cols: Optional[int] = None) -> Tuple[List[SparseRow], int]:
+    """
+    (rows, n_cols) with explicit zeros dropped. For dict rows n_cols
+    defaults to one past the largest column index present.
+    """
+    if _sp is not None and _sp.issparse(matrix):
+        csr = _sp.csr_matrix(matrix)
+        rows = []
+        for i in range(csr.shape[0]):
+            start, end = csr.indptr[i], csr.indptr[i + 1]
+            rows.append({int(j): float(v) for j, v in zip(csr.indices[start:end], csr.data[start:end]) if v != 0})
+        return rows, csr.shape[1]
+
+    if all(isinstance(row, dict) for row in matrix):
+        rows = [{int(j): v for j, v in row.items() if v != 0} for row in matrix]
+        largest = max((j for row in rows for j in row), default=-1)
+        if n_cols is None:
+            n_cols = largest + 1
+        elif largest >= n_cols:
+            raise ValueError(f"Column index {largest} out of range for {n_cols} columns")
+        return rows, n_cols
+
+    rows = [{j: v for j, v in enumerate(row) if v != 0} for row in matrix]
+    return rows, len(matrix[0]) if matrix else 0
+
+
+# ======== Factorization ========
+
+class SparseLU:
+    """
+    Elimination record of a sparse matrix.
+
+    steps holds, in pivot order, (pivot_row, pivot_col, pivot, U row without
+    the pivot entry, [(row, multiplier), ...]). Rows never chosen as pivot
+    rows are the zero rows left over when the matrix is rank deficient.
+    """
+
+    def __init__(self, shape, steps, free_rows, stats: FillStats, tol: float):
+        self.shape = shape
+        self.steps = steps
+        self.free_rows = free_rows
+        self.stats = stats
+        self.tol = tol
+
+    @property
+    def rank(self) -> int:
+        return len(self.steps)
+
+    @property
+    def is_singular(self) -> bool:
+        m, n = self.shape
+        return m != n or self.rank < n
+
+    def _forward(self, b: Sequence[float]) -> List[float]:
+        y = [float(x) for x in b]
+        for p, _, _, _, multipliers in self.steps:
+            yp = y[p]
+            if yp:
+                for r, factor in multipliers:
+                    y[r] -= factor * yp
+        return y
+
+    def is_consistent(self, b: Sequence[float]) -> bool:
+        """True if A x = b has at least one solution."""
+        y = self._forward(b)
+        return all(abs(y[r]) <= self.tol for r in self.free_rows)
+
+    def solve(self, b: Sequence[float]) -> Optional[List[float]]:
+        """The unique solution of A x = b, or None if there is none."""
+        if self.is_singular:
+            return None
+        y = self._forward(b)
+        x = [0.0] * self.shape[1]
+        for p, c, pivot, row, _ in reversed(self.steps):
+            x[c] = (y[p] - sum(v * x[j] for j, v in row.items())) / pivot
+        return x
+
+
+def sparse_factorize(
+    matrix,
+    threshold: float = DEFAULT_THRESHOLD,
+    tol: float = 1e-10,
+    search_columns: int = DEFAULT_SEARCH_COLUMNS,
+    n_cols: Optional[int] = None,
+) -> SparseLU:
+    """
+    Eliminate a sparse matrix with Markowitz pivoting.
+
+    matrix: a SciPy sparse matrix, a list of {column: value} rows or a dense
+    list of lists. Columns whose largest remaining entry is at most tol have
+    no usable pivot and are skipped. n_cols fixes the width of dict rows.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold must be in (0, 1]")
+    rows, n_cols = to_sparse_rows(matrix, n_cols)
+    m = len(rows)
+    nnz_a = sum(len(row) for row in rows)
+
+    cols: List[set] = [set() for _ in range(n_cols)]
+    for i, row in enumerate(rows):
+        for j in row:
+            cols[j].add(i)
+
+    # Lazy min-heap of (count, column); stale entries are skipped on pop
+    heap = [(len(cols[j]), j) for j in range(n_cols)]
+    heapq.heapify(heap)
+    done = [False] * n_cols
+    active = [True] * m
+
+    steps = []
+    nnz_l = nnz_u = fill_in = max_row_nnz = 0
+
+    while heap:
+        # Candidate columns: the few with the smallest current counts
+        candidates = []
+        while heap and len(candidates) < search_columns:
+            count, j = heapq.heappop(heap)
+            if done[j] or count != len(cols[j]):
+                continue
+            candidates.append(j)
+        if not candidates:
+            break
+
+        best = None
+        for j in candidates:
+            col_max = max((abs(rows[i][j]) for i in cols[j]), default=0.0)
+            if col_max <= tol:
+                # No usable pivot: drop the (numerically zero) column
+                for i in cols[j]:
+                    del rows[i][j]
+                cols[j].clear()
+                done[j] = True
+                continue
+            c_cost = len(cols[j]) - 1
+            for i in cols[j]:
+                value = rows[i][j]
+                if abs(value) >= threshold * col_max:
+                    cost = (len(rows[i]) - 1) * c_cost
+                    key = (cost, -abs(value))
+                    if best is None or key < best[0]:
+                        best = (key, i, j)
+
+        for j in candidates:
+            if not done[j] and (best is None or j != best[2]):
+                heapq.heappush(heap, (len(cols[j]), j))
+        if best is None:
+            continue
+
+        _, p, c = best
+        pivot_row = rows[p]
+        pivot = pivot_row.pop(c)
+        active[p] = False
+        done[c] = True
+        for j in pivot_row:
+            cols[j].discard(p)
+        cols[c].discard(p)
+
+        multipliers = []
+        pivot_items = list(pivot_row.items())
+        for r in cols[c]:
+            row = rows[r]
+            get = row.get
+            factor = row.pop(c) / pivot
+            multipliers.append((r, factor))
+            for j, v in pivot_items:
+                old = get(j)
+                if old is None:
+                    row[j] = -factor * v
+                    cols[j].add(r)
+                    fill_in += 1
+                else:
+                    new = old - factor * v
+                    if new == 0:
+                        del row[j]
+                        cols[j].discard(r)
+                    else:
+                        row[j] = new
+        cols[c].clear()
+
+        for j in pivot_row:
+            heapq.heappush(heap, (len(cols[j]), j))
+
+        steps.append((p, c, pivot, pivot_row, multipliers))
+        nnz_l += len(multipliers)
+        nnz_u += len(pivot_row) + 1
+        max_row_nnz = max(max_row_nnz, len(pivot_row) + 1)
+        rows[p] = None
+
+    free_rows = [i for i in range(m) if active[i]]
+    stats = FillStats(nnz_a, nnz_l, nnz_u, fill_in, len(steps), max_row_nnz)
+    return SparseLU((m, n_cols), steps, free_rows, stats, tol)
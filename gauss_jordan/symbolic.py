@@ -0,0 +1,78 @@
+"""
+Exact derivatives of a SymPy objective, compiled to NumPy.
+
+compile_objective(expr, symbols) differentiates expr once, symbolically,
+then lambdifies f, the gradient and the Hessian into one NumPy function with
+common-subexpression elimination across all three. Compiled objectives are
+cached (keyed on the expression's hash and equality), so optimizing the same
+objective again skips the symbolic work entirely.
+"""
+
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from finite_differences import Derivatives
+
+try:
+    import sympy as _sp
+except ImportError:  # SymPy is optional; only exact derivatives need it
+    _sp = None
+
+# Compiled objectives kept in the cache
+COMPILE_CACHE_SIZE = 64
+
+
+def is_expression(f) -> bool:
+    return _sp is not None and isinstance(f, _sp.Basic)
+
+
+class CompiledObjective:
+    """f, gradient and Hessian of an expression as functions of one array x."""
+
+    def __init__(self, expr, symbols: Tuple):
+        n = len(symbols)
+        grad = [_sp.diff(expr, s) for s in symbols]
+        hess = [[None] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                hess[i][j] = hess[j][i] = _sp.diff(grad[i], symbols[j])
+
+        self.symbols = symbols
+        self._fun = _sp.lambdify(symbols, expr, modules="numpy", cse=True)
+        self._grad = _sp.lambdify(symbols, [expr, grad], modules="numpy", cse=True)
+        self._all = _sp.lambdify(symbols, [expr, grad, hess], modules="numpy", cse=True)
+
+    def fun(self, x) -> float:
+        return float(self._fun(*x))
+
+    def derivatives(self, x, hessian: bool = True) -> Derivatives:
+        x = np.asarray(x, dtype=float)
+        if not hessian:
+            fx, g = self._grad(*x)
+            return Derivatives(float(fx), np.array(g, dtype=float), None, 1)
+        fx, g, H = self._all(*x)
+        return Derivatives(float(fx), np.array(g, dtype=float), np.array(H, dtype=float), 1)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile(expr, symbols: Tuple) -> CompiledObjective:
+    return CompiledObjective(expr, symbols)
+
+
+def compile_objective(expr, symbols: Optional[Sequence] = None) -> CompiledObjective:
+    """
+    Compile expr for the variables symbols (x[i] is symbols[i]); by default
+    its free symbols sorted by name.
+    """
+    if _sp is None:
+        raise ImportError("Exact derivatives need SymPy (pip install sympy)")
+    expr = _sp.sympify(expr)
+    if symbols is None:
+        symbols = sorted(expr.free_symbols, key=lambda s: s.name)
+    symbols = tuple(symbols)
+    missing = expr.free_symbols - set(symbols)
+    if missing:
+        raise ValueError(f"Expression has free symbols not in symbols: {sorted(map(str, missing))}")
+    return _compile(expr, symbols)
@@ -0,0 +1,46 @@
+import json
+import os
+import select
+import subprocess
+import sys
+
+import pytest
+
+from batch_cli import solve_record
+
+
+@pytest.mark.parametrize("A, b, backend", [
+    ([[1, 2], [3]], [1, 2], "auto"),                    # ragged row
+    ([[1, "x"], [3, 4]], [1, 2], "auto"),               # non-numeric entry
+    ([[1, 2], [3, 4]], [1], "auto"),                    # one constant short
+    ([[float("inf"), 0], [0, 1]], [1, 2], "fraction"),  # rejected by the solver
+])
+def test_rejected_systems_get_an_error(A, b, backend):
+    result = solve_record((7, A, b), backend=backend)
+    assert result["id"] == 7
+    assert set(result) == {"id", "error"}
+
+
+def test_exact_backends_accept_fraction_strings():
+    assert solve_record((0, [["1/2", 0], [0, 1]], [1, 1]), backend="fraction")["solution"] == ["2", "1"]
+
+
+def test_no_unique_solution_is_not_an_error():
+    result = solve_record((0, [[1, 2], [2, 4]], [1, 2]))
+    assert result["solution"] is None and "message" in result
+
+
+def test_results_are_streamed_through_a_pipe():
+    # The first result must arrive while stdin is still open
+    cli = os.path.join(os.path.dirname(__file__), "batch_cli.py")
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONUNBUFFERED"}
+    proc = subprocess.Popen([sys.executable, cli, "--quiet"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env)
+    try:
+        proc.stdin.write('{"A": [[2]], "b": [4]}\n')
+        proc.stdin.flush()
+        ready, _, _ = select.select([proc.stdout], [], [], 10)
+        assert ready
+        assert json.loads(proc.stdout.readline()) == {"id": 0, "solution": [2.0]}
+    finally:
+        proc.stdin.close()
+        proc.wait()
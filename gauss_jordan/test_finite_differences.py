@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from finite_differences import derivatives
+
+
+def f(p):
+    return np.exp(p[0]) * np.sin(p[1]) + p[0]**2 * p[1]**3 + p[2]**4 * p[0]
+
+
+def exact(p):
+    x, y, z = p
+    grad = [np.exp(x) * np.sin(y) + 2 * x * y**3 + z**4, np.exp(x) * np.cos(y) + 3 * x**2 * y**2, 4 * z**3 * x]
+    hess = [
+        [np.exp(x) * np.sin(y) + 2 * y**3, np.exp(x) * np.cos(y) + 6 * x * y**2, 4 * z**3],
+        [np.exp(x) * np.cos(y) + 6 * x * y**2, -np.exp(x) * np.sin(y) + 6 * x**2 * y, 0.0],
+        [4 * z**3, 0.0, 12 * z**2 * x],
+    ]
+    return np.array(grad), np.array(hess)
+
+
+@pytest.mark.parametrize("hessian", [True, False])
+def test_gradient_and_hessian_share_points(hessian):
+    x = np.array([0.7, 1.3, -0.4])
+    n = len(x)
+    d = derivatives(f, x, hessian=hessian)
+    grad, hess = exact(x)
+    assert d.evaluations == (2 * n**2 + 1 if hessian else 2 * n + 1)
+    assert np.allclose(d.grad, grad, rtol=0, atol=1e-9)
+    if hessian:
+        assert np.allclose(d.hess, hess, rtol=0, atol=1e-4)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from newton_raphson import METHODS, NONFINITE_HESSIAN, _positive_definite, newton_minimize
+
+
+def rosenbrock(p):
+    return np.sum(100 * (p[1:] - p[:-1]**2)**2 + (1 - p[:-1])**2)
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("x0", [[-1.2, 1.0], [-1.2, 1.0, -1.2, 1.0]])
+def test_converges_on_rosenbrock(method, x0):
+    r = newton_minimize(rosenbrock, x0, method=method)
+    assert r.converged
+    assert np.allclose(r.x, 1.0, atol=1e-6)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_converges_on_rosenbrock_with_exact_derivatives(method):
+    sp = pytest.importorskip("sympy")
+    x, y = sp.symbols("x y")
+    r = newton_minimize(100 * (y - x**2)**2 + (1 - x)**2, [-1.2, 1.0], symbols=(x, y), method=method)
+    assert r.converged
+    assert np.allclose(r.x, 1.0, atol=1e-8)
+
+
+def test_quasi_newton_needs_fewer_evaluations():
+    rng = np.random.default_rng(0)
+    n = 30
+    A = rng.normal(size=(n, n))
+    Q = A @ A.T / n + 0.5 * np.eye(n)
+    c = rng.normal(size=n)
+
+    def f(p):
+        return 0.5 * p @ Q @ p + c @ p + 0.05 * np.sum(p**4)
+
+    newton = newton_minimize(f, np.zeros(n))
+    for method in ("bfgs", "lbfgs"):
+        r = newton_minimize(f, np.zeros(n), method=method)
+        assert r.converged
+        assert np.allclose(r.x, newton.x, atol=1e-6)
+        assert r.f_evals < newton.f_evals
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")  # inf - inf in the differences
+def test_non_finite_hessian_stops_newton():
+    def f(p):
+        # Infinite left of x = 0, so the stencil at x = 0 sees inf
+        return np.inf if p[0] < 0 else p[0]**2 + p[1]**2
+
+    for line_search in (True, False):
+        r = newton_minimize(f, [0.0, 1.0], line_search=line_search)
+        assert not r.converged
+        assert r.message == NONFINITE_HESSIAN
+
+
+def test_positive_definite_rejects_non_finite_hessians():
+    assert _positive_definite(np.array([[np.inf, 0.0], [0.0, -1.0]])) is None
+    assert _positive_definite(np.array([[1e308, 0.0], [0.0, -1e308]])) is None
+    shifted = _positive_definite(np.array([[1.0, 2.0], [2.0, 1.0]]))
+    assert np.all(np.linalg.eigvalsh(shifted) > 0)
@@ -0,0 +1,53 @@
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import out_of_core
+from gauss_jordan import solve_linear_system
+from out_of_core import factorize_out_of_core, panel_width
+
+
+@pytest.mark.parametrize("n, memory_budget", [(600, 1 << 20), (1500, 16 << 20)])
+def test_peak_memory_within_budget(tmp_path, n, memory_budget):
+    A = np.random.default_rng(0).normal(size=(n, n))
+    np.save(tmp_path / "a.npy", A)
+
+    tracemalloc.start()
+    try:
+        lu = factorize_out_of_core(tmp_path / "a.npy", str(tmp_path / "lu.npy"), memory_budget=memory_budget)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert lu.stats.panel_width == panel_width(n, memory_budget) < n
+    assert peak <= memory_budget
+    b = np.ones(n)
+    assert np.allclose(A @ lu.solve(b), b)
+
+
+def test_solve_linear_system_passes_memory_budget(tmp_path):
+    n, memory_budget = 300, 1 << 20
+    A = np.random.default_rng(1).normal(size=(n, n))
+    np.save(tmp_path / "a.npy", A)
+    b = np.ones(n)
+
+    x, steps = solve_linear_system(str(tmp_path / "a.npy"), b.tolist(), memory_budget=memory_budget)
+    assert f"width {panel_width(n, memory_budget)}," in "\n".join(steps)
+    assert np.allclose(A @ x, b)
+
+
+def test_failed_factorization_removes_working_copy(tmp_path, monkeypatch):
+    np.save(tmp_path / "a.npy", np.eye(50))
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(scratch))
+
+    def fail(panel, tol):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(out_of_core, "_factor_panel", fail)
+    with pytest.raises(OSError):
+        factorize_out_of_core(tmp_path / "a.npy")
+    assert not any(scratch.iterdir())
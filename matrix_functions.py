@@ -0,0 +1,144 @@
+"""
+Matrix functions on top of cached decompositions: A^k, exp(tA), f(A).
+
+For a diagonalizable matrix A = P D P^-1, so f(A) = P f(D) P^-1, and once
+P, D (from analyze_matrix) and P^-1 are cached, every further k or t costs
+one elementwise map over the diagonal plus two matrix multiplications.
+Non-diagonalizable matrices fall back to the Jordan form, where f acts on
+each Jordan block through the derivatives of f.
+"""
+
+from functools import lru_cache
+from math import factorial
+
+import numpy as np
+from sympy import Dummy, Matrix, diff, exp, zeros
+
+from diagonlize import analyze_matrix
+from eigen_numeric import numeric_eigen_data
+
+try:
+    from scipy.linalg import expm as _dense_expm
+except ImportError:  # SciPy is optional; only needed for defective numeric input
+    _dense_expm = None
+
+_X = Dummy("x")
+
+
+# ======== Cached Decompositions ========
+
+@lru_cache(maxsize=32)
+def _symbolic_decomposition(matrix_tuple):
+    """
+    ("diagonal", P, [d_1, ..., d_n], P^-1) when A is diagonalizable,
+    ("jordan", P, J, P^-1) otherwise.
+    """
+    result = analyze_matrix(matrix_tuple)
+    if result["diagonalizable"]:
+        P, D = result["P"], result["D"]
+        return "diagonal", P, [D[i, i] for i in range(D.rows)], P.inv()
+    P, J = Matrix(matrix_tuple).jordan_form()
+    return "jordan", P, J, P.inv()
+
+
+def _jordan_blocks(J):
+    """(start, size, eigenvalue) for every Jordan block of J."""
+    blocks = []
+    i = 0
+    while i < J.rows:
+        size = 1
+        while i + size < J.rows and J[i + size - 1, i + size] == 1:
+            size += 1
+        blocks.append((i, size, J[i, i]))
+        i += size
+    return blocks
+
+
+def _apply(matrix_tuple, fx):
+    """f(A) for f given as a SymPy expression in _X."""
+    kind, P, D, P_inv = _symbolic_decomposition(matrix_tuple)
+    if kind == "diagonal":
+        return P * Matrix.diag(*[fx.subs(_X, d) for d in D]) * P_inv
+
+    # f(J) on a Jordan block: f^(r)(λ) / r! on the r-th superdiagonal
+    F = zeros(D.rows, D.rows)
+    for start, size, val in _jordan_blocks(D):
+        derivatives = [diff(fx, _X, r).subs(_X, val) / factorial(r) for r in range(size)]
+        for a in range(size):
+            for b in range(a, size):
+                F[start + a, start + b] = derivatives[b - a]
+    return P * F * P_inv
+
+
+def _as_tuple(A):
+    return tuple(tuple(row) for row in A)
+
+
+# ======== Symbolic API ========
+
+def power(A, k):
+    """A^k (k may be a symbol), exact."""
+    return _apply(_as_tuple(A), _X ** k)
+
+
+def expm(A, t=1):
+    """exp(tA) (t may be a symbol), exact."""
+    return _apply(_as_tuple(A), exp(t * _X))
+
+
+def matrix_function(A, f):
+    """
+    f(A) for a callable f acting on SymPy expressions, e.g.
+    matrix_function(A, lambda x: sin(x)). Defective matrices need f to be
+    differentiable so it can act on the Jordan blocks.
+    """
+    return _apply(_as_tuple(A), f(_X))
+
+
+# ======== Vectorized Numeric API ========
+
+@lru_cache(maxsize=32)
+def _numeric_decomposition(matrix_tuple):
+    # (w, P, P^-1) for a numerically diagonalizable matrix, else None
+    data = numeric_eigen_data(matrix_tuple)
+    if not data["diagonalizable"]:
+        return None
+    P = data["P"]
+    return np.diag(data["D"]), P, np.linalg.inv(P)
+
+
+def _real_if_close(values, A):
+    if not np.iscomplexobj(A) and np.allclose(values.imag, 0, atol=1e-12 * max(1.0, np.abs(values).max())):
+        return values.real
+    return values
+
+
+def _diagonal_map(A, scalar_values):
+    """Stack of P diag(s) P^-1 for every row s of scalar_values (T, n)."""
+    w, P, P_inv = _numeric_decomposition(_as_tuple(np.asarray(A).tolist()))
+    return np.einsum("ij,tj,jk->tik", P, scalar_values(w), P_inv)
+
+
+def expm_numeric(A, ts):
+    """
+    exp(t A) for every t in ts, as a (len(ts), n, n) array. Diagonalizable
+    matrices cost one exp over a (len(ts), n) array plus two products.
+    """
+    A = np.asarray(A)
+    ts = np.atleast_1d(np.asarray(ts))
+    if _numeric_decomposition(_as_tuple(A.tolist())) is None:
+        if _dense_expm is None:
+            raise ImportError("scipy is required for exp(tA) of a defective matrix")
+        return np.stack([_dense_expm(t * A) for t in ts])
+    values = _diagonal_map(A, lambda w: np.exp(np.outer(ts, w)))
+    return _real_if_close(values, A)
+
+
+def power_numeric(A, ks):
+    """A^k for every k in ks, as a (len(ks), n, n) array."""
+    A = np.asarray(A)
+    ks = np.atleast_1d(np.asarray(ks))
+    if _numeric_decomposition(_as_tuple(A.tolist())) is None:
+        return np.stack([np.linalg.matrix_power(A, int(k)) for k in ks])
+    values = _diagonal_map(A, lambda w: w[None, :] ** ks[:, None])
+    return _real_if_close(values, A)
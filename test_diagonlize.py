@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from sympy import Matrix
+
+from diagonlize import analyze_matrices, compute_eigen_data
+from eigen_cache import set_default_cache
+
+
+@pytest.fixture(autouse=True)
+def no_persistent_cache():
+    set_default_cache(None)
+    compute_eigen_data.cache_clear()
+    yield
+    compute_eigen_data.cache_clear()
+
+
+@pytest.mark.parametrize("A", [
+    [[2, 1, 0, 0], [1, 2, 0, 0], [0, 0, 3, 1], [0, 0, 1, 3]],
+    [[1, 0, 2], [0, 5, 0], [3, 0, 4]],
+    [[3, 0, 0], [0, 1, 0], [0, 0, 2]],
+    [[3, 1, 0], [0, 1, 0], [0, 0, 2]],
+])
+def test_structured_paths_match_sympy_diagonalize(A):
+    P, D = Matrix(A).diagonalize()
+    data = compute_eigen_data(tuple(map(tuple, A)))
+    assert data["structure"] != "general"
+    assert data["D"] == D
+    assert data["P"] == P
+
+
+def test_exact_recheck_keeps_imaginary_parts():
+    # Nilpotent, so defective; its real part [[1, 0], [0, -1]] is diagonal
+    stack = np.array([[[1, 1j], [1j, -1]]])
+    out = analyze_matrices(stack, exact_recheck=True)
+    assert out["exact"][0]
+    assert not out["diagonalizable"][0]
+    assert list(out["geometric_multiplicity"][0]) == [1, 1]